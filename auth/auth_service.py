@@ -5,7 +5,7 @@ from PyQt6.QtCore import QObject, pyqtSignal
 from .login_manager import LoginManager
 from .session_manager import SessionManager, UserSession
 from .rbac import RoleBasedAccessControl, Permission, Role
-from database.data_access import DataAccessLayer
+from database.data_access import get_data_access
 from core.config import DATABASE_PATH
 
 class AuthenticationService(QObject):
@@ -22,7 +22,7 @@ class AuthenticationService(QObject):
         # Initialize database schema if needed
         self._ensure_database_schema()
         
-        self.db_manager = DataAccessLayer(str(DATABASE_PATH))
+        self.db_manager = get_data_access(str(DATABASE_PATH))
         self.login_manager = LoginManager(self.db_manager)
         self.session_manager = SessionManager()
         self.rbac = RoleBasedAccessControl()
@@ -1,11 +1,20 @@
 # Login Manager for user authentication
 import hashlib
+import hmac
+import secrets
 import sqlite3
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 from database.data_access import DataAccessLayer
 from utils.helpers import validate_username, validate_pin, clean_string
 
+# Using a fixed salt for now - in production, use a random per-user salt
+PIN_SALT = "scale_system_salt_2025"
+
+# Hash of a random PIN nobody knows, verified against when a username does not
+# exist so unknown and known users take the same time to reject
+DUMMY_PIN_HASH = hashlib.sha256((secrets.token_urlsafe(20) + PIN_SALT).encode()).hexdigest()
+
 class LoginManager:
     """Handles user login, PIN verification, and authentication"""
     
@@ -17,13 +26,24 @@ class LoginManager:
         
     def hash_pin(self, pin: str) -> str:
         """Hash a PIN using SHA-256 with salt"""
-        # Using the username as salt for now - in production, use random salt
-        salt = "scale_system_salt_2025"
-        return hashlib.sha256((pin + salt).encode()).hexdigest()
+        return hashlib.sha256((pin + PIN_SALT).encode()).hexdigest()
+    
+    def verify_pin(self, pin: str, pin_hash: str) -> bool:
+        """Verify a PIN against a stored hash in constant time"""
+        return hmac.compare_digest(self.hash_pin(pin).encode(), (pin_hash or '').encode())
     
-    def authenticate_user(self, username: str, pin: str) -> Optional[Dict[str, Any]]:
+    def verify_dummy_pin(self, pin: str) -> bool:
+        """Run a PIN check that always fails, so rejections take the same time"""
+        return self.verify_pin(pin, DUMMY_PIN_HASH)
+    
+    def authenticate_user(self, username: str, pin: str,
+                          user: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
         """Authenticate user with username and PIN
         
+        Args:
+            user: Previously fetched user record (from get_user_by_username)
+                  to skip the database lookup, e.g. when retrying a PIN
+        
         Returns:
             Dict with user info if successful, None if failed
         """
@@ -36,14 +56,15 @@ class LoginManager:
             return None
             
         # Get user from database
-        user = self.get_user_by_username(username)
+        if user is None:
+            user = self.get_user_by_username(username)
         if not user:
+            self.verify_dummy_pin(pin)
             self.log_failed_attempt(username, "User not found")
             return None
             
         # Verify PIN
-        pin_hash = self.hash_pin(pin)
-        if user['pin_hash'] != pin_hash:
+        if not self.verify_pin(pin, user['pin_hash']):
             self.log_failed_attempt(username, "Invalid PIN")
             return None
             
@@ -77,15 +98,14 @@ class LoginManager:
     def get_user_by_username(self, username: str) -> Optional[Dict[str, Any]]:
         """Get user record from database"""
         try:
-            query = "SELECT id, username, pin_hash, role FROM users WHERE username = ? AND active = 1"
-            result = self.db.execute_query(query, (username,))
+            result = self.db.fetch_auth_user(username)
             
             if result:
                 return {
-                    'id': result[0][0],
-                    'username': result[0][1],
-                    'pin_hash': result[0][2],
-                    'role': result[0][3]
+                    'id': result['id'],
+                    'username': result['username'],
+                    'pin_hash': result['pin_hash'],
+                    'role': result['role']
                 }
             return None
             
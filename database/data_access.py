@@ -5,13 +5,16 @@ Provides high-level database operations with proper error handling and transacti
 """
 
 import sqlite3
+import threading
+import time
 import uuid
 import json
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple, Any
+from typing import Callable, List, Dict, Iterator, Optional, Tuple, Any
 from contextlib import contextmanager
 from dataclasses import dataclass
 import hashlib
+import hmac
 
 @dataclass
 class Transaction:
@@ -50,26 +53,160 @@ class WeighEvent:
 class DataAccessLayer:
     """Main data access layer for SCALE system"""
     
+    # Login lookup, kept as one constant string so sqlite's per-connection
+    # statement cache reuses the prepared statement on every attempt
+    AUTH_USER_QUERY = (
+        "SELECT id, username, pin_hash, role FROM users "
+        "WHERE username = ? AND active = 1 LIMIT 1"
+    )
+    
+    # Active master data for the weighing dropdowns, cached for MASTER_DATA_TTL
+    MASTER_DATA_QUERIES = {
+        'products': "SELECT id, name FROM products WHERE is_active = 1 ORDER BY name",
+        'parties': "SELECT id, name, type FROM parties WHERE is_active = 1 ORDER BY name",
+        'transporters': "SELECT id, name FROM transporters WHERE is_active = 1 ORDER BY name",
+    }
+    MASTER_DATA_TTL = 60  # seconds
+    
+    # Newest transactions for the weighing tab, cached per transactions_version
+    RECENT_TRANSACTIONS_QUERY = """
+        SELECT ticket_no, vehicle_no, COALESCE(net_weight, 0) AS net_weight,
+               status, opened_at_utc AS created_at
+        FROM transactions
+        ORDER BY opened_at_utc DESC
+        LIMIT ?
+    """
+    
     def __init__(self, db_path: str):
         self.db_path = db_path
+        self._local = threading.local()
+        self._master_data_cache: Dict[str, Tuple[float, List[Dict]]] = {}
+        self._master_data_lock = threading.Lock()
+        # Bumped on every write that may touch transactions, and whenever
+        # PRAGMA data_version shows a commit from another connection; cached
+        # reads made under an older version are never served
+        self._transactions_version = 0
+        self._recent_transactions_cache: Dict[int, Tuple[int, List[Dict]]] = {}
+        self._transactions_lock = threading.Lock()
         self._ensure_connection()
     
     def _ensure_connection(self):
         """Ensure database connection is properly configured"""
-        with sqlite3.connect(self.db_path) as conn:
+        conn = sqlite3.connect(self.db_path)
+        try:
             conn.execute("PRAGMA foreign_keys=ON")
+            # Persistent database setting: readers no longer block on writers
             conn.execute("PRAGMA journal_mode=WAL")
+        finally:
+            conn.close()
+    
+    def _configure_connection(self, conn: sqlite3.Connection):
+        """Apply per-connection settings"""
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA foreign_keys=ON")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
     
     @contextmanager
     def get_connection(self):
-        """Get database connection with proper configuration"""
-        conn = sqlite3.connect(self.db_path)
-        conn.execute("PRAGMA foreign_keys=ON")
-        conn.row_factory = sqlite3.Row
+        """Get database connection with proper configuration
+        
+        Each thread reuses one long-lived connection. Work that the caller
+        did not commit is rolled back when the outermost block exits, just
+        as closing a fresh connection used to discard it.
+        """
+        conn = self._get_thread_connection()
+        self._local.depth = getattr(self._local, 'depth', 0) + 1
         try:
             yield conn
         finally:
-            conn.close()
+            self._local.depth -= 1
+            if self._local.depth == 0 and conn.in_transaction:
+                conn.rollback()
+    
+    def _get_thread_connection(self) -> sqlite3.Connection:
+        """Get this thread's long-lived connection"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, cached_statements=256)
+            self._configure_connection(conn)
+            self._local.conn = conn
+        return conn
+    
+    def fetch_auth_user(self, username: str) -> Optional[sqlite3.Row]:
+        """Fetch the active user record used for login"""
+        return self._get_thread_connection().execute(
+            self.AUTH_USER_QUERY, (username,)
+        ).fetchone()
+    
+    def get_master_data(self, table: str) -> List[Dict]:
+        """Get active rows of a master-data table, served from cache while fresh
+        
+        Callers get their own copies, so changing them leaves the cache intact.
+        """
+        with self._master_data_lock:
+            cached = self._master_data_cache.get(table)
+            if cached and time.monotonic() - cached[0] < self.MASTER_DATA_TTL:
+                return [dict(row) for row in cached[1]]
+        
+        rows = [dict(row) for row in self._get_thread_connection().execute(
+            self.MASTER_DATA_QUERIES[table]
+        ).fetchall()]
+        
+        with self._master_data_lock:
+            self._master_data_cache[table] = (time.monotonic(), rows)
+        return [dict(row) for row in rows]
+    
+    def get_master_data_snapshot(self) -> Dict[str, List[Dict]]:
+        """Get every master-data table in one call, keyed by table name"""
+        with self.get_connection():
+            return {table: self.get_master_data(table) for table in self.MASTER_DATA_QUERIES}
+    
+    def invalidate_master_data(self):
+        """Drop cached master data after products, parties or transporters change"""
+        with self._master_data_lock:
+            self._master_data_cache.clear()
+    
+    def get_recent_transactions(self, limit: int = 10) -> List[Dict]:
+        """Get the newest transactions, served from cache until a write
+        
+        Callers get their own copies, so changing them leaves the cache intact.
+        """
+        conn = self._get_thread_connection()
+        self._check_external_writes(conn)
+        
+        with self._transactions_lock:
+            version = self._transactions_version
+            cached = self._recent_transactions_cache.get(limit)
+            if cached and cached[0] == version:
+                return [dict(row) for row in cached[1]]
+        
+        rows = [dict(row) for row in conn.execute(
+            self.RECENT_TRANSACTIONS_QUERY, (limit,)
+        ).fetchall()]
+        
+        with self._transactions_lock:
+            self._recent_transactions_cache[limit] = (version, rows)
+        return [dict(row) for row in rows]
+    
+    def _check_external_writes(self, conn: sqlite3.Connection):
+        """Invalidate cached transaction reads if another connection committed
+        
+        PRAGMA data_version changes on a connection whenever any other
+        connection (another thread, another DataAccessLayer or another
+        process) commits, so this also catches writes this instance never saw.
+        """
+        data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+        if data_version != getattr(self._local, 'data_version', None):
+            self._local.data_version = data_version
+            self._transactions_changed()
+    
+    def _transactions_changed(self):
+        """Invalidate cached transaction reads after a write"""
+        with self._transactions_lock:
+            self._transactions_version += 1
+            self._recent_transactions_cache.clear()
     
     def create_transaction(self, vehicle_no: str, mode: str, operator_id: str, 
                           product_id: Optional[str] = None, party_id: Optional[str] = None,
@@ -111,6 +248,7 @@ class DataAccessLayer:
                                  })
             
             conn.commit()
+            self._transactions_changed()
             return transaction_id
     
     def add_weigh_event(self, transaction_id: str, seq: int, weight: float, 
@@ -219,6 +357,7 @@ class DataAccessLayer:
                                  {'status': 'pending'}, {'status': 'complete', 'net_weight': net_weight})
             
             conn.commit()
+            self._transactions_changed()
             return True
     
     def void_transaction(self, transaction_id: str, operator_id: str, reason: str) -> bool:
@@ -249,6 +388,7 @@ class DataAccessLayer:
                                  {'status': 'complete'}, {'status': 'void'})
             
             conn.commit()
+            self._transactions_changed()
             return True
     
     def get_pending_transactions(self) -> List[Dict]:
@@ -315,7 +455,7 @@ class DataAccessLayer:
             # If PIN is provided, verify it
             if pin is not None and user['pin_hash']:
                 pin_hash = hashlib.sha256(pin.encode()).hexdigest()
-                if pin_hash != user['pin_hash']:
+                if not hmac.compare_digest(pin_hash.encode(), user['pin_hash'].encode()):
                     return None
             
             return dict(user)
@@ -387,44 +527,66 @@ class DataAccessLayer:
         decimal_places = self.get_setting('weight_decimal_places') or 2
         return round(weight, decimal_places)
     
+    AUDIT_LOG_INSERT = """
+        INSERT INTO audit_log 
+        (id, operator_id, action, entity, entity_id, reason, before_state, after_state, logged_at_utc)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    
+    def _audit_row(self, operator_id: str, action: str, entity: str, entity_id: str,
+                   reason: str, before_state: Optional[Dict],
+                   after_state: Optional[Dict]) -> tuple:
+        """Build the AUDIT_LOG_INSERT parameters for one entry"""
+        return (str(uuid.uuid4()), operator_id, action, entity, entity_id, reason,
+                json.dumps(before_state) if before_state else None,
+                json.dumps(after_state) if after_state else None,
+                datetime.utcnow().isoformat())
+    
     def _create_audit_log(self, conn: sqlite3.Connection, operator_id: str, 
                          action: str, entity: str, entity_id: str, reason: str,
                          before_state: Optional[Dict], after_state: Optional[Dict]) -> str:
         """Create an audit log entry"""
         
-        log_id = str(uuid.uuid4())
-        current_time = datetime.utcnow().isoformat()
+        row = self._audit_row(operator_id, action, entity, entity_id, reason,
+                              before_state, after_state)
+        conn.execute(self.AUDIT_LOG_INSERT, row)
+        return row[0]
+    
+    # Pages copied per backup step when progress is reported
+    BACKUP_STEP_PAGES = 256
+    
+    def _backup_options(self, progress_callback: Optional[Callable[[int], None]]) -> Dict:
+        """sqlite3 backup() arguments reporting percent done to progress_callback"""
+        if not progress_callback:
+            return {}
         
-        conn.execute("""
-            INSERT INTO audit_log 
-            (id, operator_id, action, entity, entity_id, reason, before_state, after_state, logged_at_utc)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (log_id, operator_id, action, entity, entity_id, reason,
-              json.dumps(before_state) if before_state else None,
-              json.dumps(after_state) if after_state else None,
-              current_time))
+        def report(status, remaining, total):
+            progress_callback(100 * (total - remaining) // total if total else 100)
         
-        return log_id
+        return {'pages': self.BACKUP_STEP_PAGES, 'progress': report}
     
-    def create_backup(self, backup_path: str) -> bool:
+    def create_backup(self, backup_path: str,
+                      progress_callback: Optional[Callable[[int], None]] = None) -> bool:
         """Create database backup"""
         
         try:
             with sqlite3.connect(self.db_path) as source:
                 with sqlite3.connect(backup_path) as backup:
-                    source.backup(backup)
+                    source.backup(backup, **self._backup_options(progress_callback))
             return True
         except Exception as e:
             print(f"Backup failed: {e}")
             return False
     
-    def restore_backup(self, backup_path: str) -> bool:
+    def restore_backup(self, backup_path: str,
+                       progress_callback: Optional[Callable[[int], None]] = None) -> bool:
         """Restore database from backup"""
         
         try:
             with sqlite3.connect(backup_path) as source:
                 with sqlite3.connect(self.db_path) as target:
-                    source.backup(target)
+                    source.backup(target, **self._backup_options(progress_callback))
+            self._transactions_changed()
             return True
         except Exception as e:
             print(f"Restore failed: {e}")
@@ -439,6 +601,56 @@ class DataAccessLayer:
                 cursor = conn.execute(query)
             return [dict(row) for row in cursor.fetchall()]
     
+    def iter_query(self, query: str, params: Optional[tuple] = None,
+                   batch_size: int = 1000) -> Iterator[Dict]:
+        """Execute a SELECT query and stream results as dictionaries"""
+        with self.get_connection() as conn:
+            cursor = conn.execute(query, params or ())
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield dict(row)
+    
+    @contextmanager
+    def batch(self):
+        """Group writes on this thread into one transaction
+        
+        Inside the block execute_insert/execute_update skip their own commit
+        and log_audit_action only queues its entry. On exit the queued audit
+        entries are inserted with one executemany and everything commits
+        once; an exception rolls the whole batch back. Nested blocks join
+        the outermost one.
+        """
+        with self.get_connection() as conn:
+            if self._in_batch():
+                yield
+                return
+            
+            self._local.audit_batch = []
+            try:
+                yield
+                if self._local.audit_batch:
+                    conn.executemany(self.AUDIT_LOG_INSERT, self._local.audit_batch)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                self._local.audit_batch = None
+                self._transactions_changed()
+    
+    def _in_batch(self) -> bool:
+        """Whether the calling thread is inside a batch() block"""
+        return getattr(self._local, 'audit_batch', None) is not None
+    
+    def _commit_write(self, conn: sqlite3.Connection):
+        """Commit a single write, unless a batch() will commit it later"""
+        if not self._in_batch():
+            conn.commit()
+            self._transactions_changed()
+    
     def execute_insert(self, query: str, params: Optional[tuple] = None) -> int:
         """Execute an INSERT query and return the last row id"""
         with self.get_connection() as conn:
@@ -446,7 +658,7 @@ class DataAccessLayer:
                 cursor = conn.execute(query, params)
             else:
                 cursor = conn.execute(query)
-            conn.commit()
+            self._commit_write(conn)
             return cursor.lastrowid
     
     def execute_update(self, query: str, params: Optional[tuple] = None) -> int:
@@ -456,22 +668,47 @@ class DataAccessLayer:
                 cursor = conn.execute(query, params)
             else:
                 cursor = conn.execute(query)
-            conn.commit()
+            self._commit_write(conn)
             return cursor.rowcount
     
     def close(self):
-        """Close database connections. Using context managers, so this is a no-op."""
-        # No persistent connection to close since we use context managers
-        pass
+        """Close the calling thread's connection"""
+        # Other threads' connections are closed when those threads exit
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
     
     def log_audit_action(self, operator_id: str, action: str, entity: str,
                         entity_id: str, reason: str = None, 
                         before_state: dict = None, after_state: dict = None) -> str:
-        """Log audit action (public method for compatibility)"""
+        """Log audit action (public method for compatibility)
+        
+        Inside batch() the entry is queued and written when the batch commits.
+        """
+        if self._in_batch():
+            row = self._audit_row(operator_id, action, entity, entity_id, reason,
+                                  before_state, after_state)
+            self._local.audit_batch.append(row)
+            return row[0]
+        
         with self.get_connection() as conn:
-            return self._create_audit_log(conn, operator_id, action, entity, 
-                                        entity_id, reason, before_state, after_state)
+            log_id = self._create_audit_log(conn, operator_id, action, entity, 
+                                            entity_id, reason, before_state, after_state)
+            conn.commit()
+            return log_id
+
+# Shared data access layer instances, one per database path
+_data_access_layers: Dict[str, DataAccessLayer] = {}
+_data_access_lock = threading.Lock()
 
+def get_data_access(db_path: str) -> DataAccessLayer:
+    """Get the shared data access layer for a database, creating it once"""
+    with _data_access_lock:
+        dal = _data_access_layers.get(db_path)
+        if dal is None:
+            dal = _data_access_layers[db_path] = DataAccessLayer(db_path)
+        return dal
 
 if __name__ == "__main__":
     # Test data access layer
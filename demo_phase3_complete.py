@@ -233,7 +233,7 @@ def demonstrate_technical_features():
         "Multi-Threading": [
             "Background port scanning (PortScanWorker)",
             "Connection testing (ConnectionTestWorker)", 
-            "Real-time weight monitoring (WeightDisplayWorker)",
+            "Real-time weight monitoring (WeightWorker)",
             "Non-blocking authentication (LoginAttemptWorker)"
         ],
         "Professional UI/UX": [
@@ -7,6 +7,8 @@ Manages hardware profiles and diagnostic tools
 from typing import Dict, List, Any
 from dataclasses import dataclass, asdict
 import json
+import os
+import re
 from pathlib import Path
 
 @dataclass
@@ -54,59 +56,146 @@ class SerialProfile:
         return cls(**data)
 
 class HardwareProfileManager:
-    """Manages hardware profiles"""
+    """Manages hardware profiles
+    
+    Each profile is stored in its own JSON file under
+    ``<config_dir>/hardware_profiles/`` with a small ``index.json`` that
+    maps profile names to files. Listing profiles only reads the index and
+    profiles are loaded on first access, so a single corrupt or partially
+    written file cannot take down the whole profile set.
+    """
     
     def __init__(self, config_dir: str = "config"):
         self.config_dir = Path(config_dir)
         self.config_dir.mkdir(exist_ok=True)
+        self.profiles_dir = self.config_dir / "hardware_profiles"
+        self.profiles_dir.mkdir(exist_ok=True)
+        self.index_file = self.profiles_dir / "index.json"
+        
+        # Legacy single-file storage, migrated on first run
         self.profiles_file = self.config_dir / "hardware_profiles.json"
         
-        # Load profiles
-        self.profiles = self._load_profiles()
+        # Profile cache (name -> SerialProfile), filled lazily
+        self.profiles: Dict[str, SerialProfile] = {}
+        
+        # Load profile index
+        self.index = self._load_index()
         
         # Ensure default profile exists
-        if not self.profiles:
+        if not self.index:
             self._create_default_profiles()
     
-    def _load_profiles(self) -> Dict[str, SerialProfile]:
-        """Load profiles from file"""
+    def _load_index(self) -> Dict[str, str]:
+        """Load the profile index, migrating legacy storage if needed"""
+        
+        if not self.index_file.exists():
+            return self._migrate_legacy_profiles()
+        
+        try:
+            with open(self.index_file, 'r') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"Error loading profile index: {e}")
+            return self._rebuild_index()
+    
+    def _rebuild_index(self) -> Dict[str, str]:
+        """Rebuild the index by scanning the per-profile files"""
+        
+        index = {}
+        for profile_path in sorted(self.profiles_dir.glob('*.json')):
+            if profile_path == self.index_file:
+                continue
+            try:
+                with open(profile_path, 'r') as f:
+                    index[json.load(f)['name']] = profile_path.name
+            except Exception as e:
+                print(f"Skipping unreadable profile {profile_path.name}: {e}")
+        
+        self._write_json(self.index_file, index)
+        return index
+    
+    def _migrate_legacy_profiles(self) -> Dict[str, str]:
+        """Split the legacy hardware_profiles.json into per-profile files"""
         
         if not self.profiles_file.exists():
-            return {}
+            return self._rebuild_index()
         
         try:
             with open(self.profiles_file, 'r') as f:
                 data = json.load(f)
             
-            profiles = {}
-            for name, profile_data in data.items():
-                profiles[name] = SerialProfile.from_dict(profile_data)
+            self.index = {}
+            for profile_data in data.values():
+                self._save_profile(SerialProfile.from_dict(profile_data), write_index=False)
             
-            return profiles
+            self._write_json(self.index_file, self.index)
+            return self.index
             
         except Exception as e:
-            print(f"Error loading profiles: {e}")
+            print(f"Error migrating profiles: {e}")
             return {}
     
-    def _save_profiles(self):
-        """Save profiles to file"""
+    @staticmethod
+    def _profile_filename(name: str) -> str:
+        """Build a filesystem-safe file name for a profile"""
+        safe_name = re.sub(r'[^A-Za-z0-9_.-]', '_', name)
+        return f"{safe_name}.json"
+    
+    @staticmethod
+    def _write_json(path: Path, data: Any):
+        """Write JSON atomically so readers never see a partial file"""
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, path)
+    
+    def _save_profile(self, profile: SerialProfile, write_index: bool = True):
+        """Save a single profile and update the index"""
         
         try:
-            data = {}
-            for name, profile in self.profiles.items():
-                data[name] = profile.to_dict()
+            filename = self.index.get(profile.name) or self._profile_filename(profile.name)
+            
+            # Avoid clobbering the index or another profile whose name sanitizes the same
+            taken = (set(self.index.values()) - {self.index.get(profile.name)}) | {self.index_file.name}
+            stem = filename[:-len('.json')]
+            suffix = 1
+            while filename in taken:
+                filename = f"{stem}_{suffix}.json"
+                suffix += 1
+            
+            self._write_json(self.profiles_dir / filename, profile.to_dict())
+            self.index[profile.name] = filename
+            self.profiles[profile.name] = profile
             
-            with open(self.profiles_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            if write_index:
+                self._write_json(self.index_file, self.index)
                 
         except Exception as e:
-            print(f"Error saving profiles: {e}")
+            print(f"Error saving profile: {e}")
+    
+    def _remove_profile(self, name: str):
+        """Remove a single profile file and its index entry"""
+        
+        try:
+            filename = self.index.pop(name)
+            self.profiles.pop(name, None)
+            
+            profile_path = self.profiles_dir / filename
+            if profile_path.exists():
+                profile_path.unlink()
+            
+            self._write_json(self.index_file, self.index)
+            
+        except Exception as e:
+            print(f"Error removing profile: {e}")
     
     def _create_default_profiles(self):
         """Create default hardware profiles"""
         
+        defaults = {}
+        
         # Generic profile
-        self.profiles['Generic'] = SerialProfile(
+        defaults['Generic'] = SerialProfile(
             name='Generic',
             port='COM1',
             baud_rate=9600,
@@ -116,7 +205,7 @@ class HardwareProfileManager:
         )
         
         # RS232 Fast Profile (19200 baud)
-        self.profiles['RS232_Fast'] = SerialProfile(
+        defaults['RS232_Fast'] = SerialProfile(
             name='RS232_Fast',
             port='COM1',
             baud_rate=19200,
@@ -127,7 +216,7 @@ class HardwareProfileManager:
         )
         
         # RS232 High Speed Profile (38400 baud)
-        self.profiles['RS232_HighSpeed'] = SerialProfile(
+        defaults['RS232_HighSpeed'] = SerialProfile(
             name='RS232_HighSpeed',
             port='COM1',
             baud_rate=38400,
@@ -138,7 +227,7 @@ class HardwareProfileManager:
         )
         
         # RS232 Ultra Fast Profile (115200 baud)
-        self.profiles['RS232_Ultra'] = SerialProfile(
+        defaults['RS232_Ultra'] = SerialProfile(
             name='RS232_Ultra',
             port='COM1',
             baud_rate=115200,
@@ -149,7 +238,7 @@ class HardwareProfileManager:
         )
         
         # Toledo profile
-        self.profiles['Toledo'] = SerialProfile(
+        defaults['Toledo'] = SerialProfile(
             name='Toledo',
             port='COM1',
             baud_rate=9600,
@@ -160,7 +249,7 @@ class HardwareProfileManager:
         )
         
         # Avery profile
-        self.profiles['Avery'] = SerialProfile(
+        defaults['Avery'] = SerialProfile(
             name='Avery',
             port='COM1',
             baud_rate=9600,
@@ -170,55 +259,70 @@ class HardwareProfileManager:
         )
         
         # Save default profiles
-        self._save_profiles()
+        for profile in defaults.values():
+            self._save_profile(profile, write_index=False)
+        self._write_json(self.index_file, self.index)
     
     def get_profile(self, name: str) -> SerialProfile:
         """Get profile by name"""
         
-        if name not in self.profiles:
+        if name not in self.index:
             raise ValueError(f"Profile '{name}' not found")
         
+        if name not in self.profiles:
+            with open(self.profiles_dir / self.index[name], 'r') as f:
+                self.profiles[name] = SerialProfile.from_dict(json.load(f))
+        
         return self.profiles[name]
     
+    def list_profiles(self) -> List[str]:
+        """Get profile names without loading the profiles themselves"""
+        return list(self.index)
+    
     def get_all_profiles(self) -> Dict[str, SerialProfile]:
         """Get all profiles"""
-        return self.profiles.copy()
+        
+        profiles = {}
+        for name in self.index:
+            try:
+                profiles[name] = self.get_profile(name)
+            except Exception as e:
+                print(f"Error loading profile '{name}': {e}")
+        
+        return profiles
     
     def create_profile(self, profile: SerialProfile) -> bool:
         """Create a new profile"""
         
-        if profile.name in self.profiles:
+        if profile.name in self.index:
             return False  # Profile already exists
         
-        self.profiles[profile.name] = profile
-        self._save_profiles()
+        self._save_profile(profile)
         return True
     
     def update_profile(self, name: str, profile: SerialProfile) -> bool:
         """Update existing profile"""
         
-        if name not in self.profiles:
+        if name not in self.index:
             return False  # Profile doesn't exist
         
         # Update name if changed
         if name != profile.name:
-            del self.profiles[name]
+            self._remove_profile(name)
         
-        self.profiles[profile.name] = profile
-        self._save_profiles()
+        self._save_profile(profile)
         return True
     
     def delete_profile(self, name: str) -> bool:
         """Delete profile"""
         
-        if name not in self.profiles:
+        if name not in self.index:
             return False
         
         if name == 'Generic':  # Don't allow deleting default profile
             return False
         
-        del self.profiles[name]
-        self._save_profiles()
+        self._remove_profile(name)
         return True
     
     def get_available_ports(self) -> List[str]:
@@ -226,6 +226,18 @@ class RS232Manager:
         self.config = None
         self.status = RS232Status.DISCONNECTED
     
+    def cancel_read(self):
+        """Wake a read_data() call blocked in another thread
+        
+        Safe to call from any thread; the interrupted read returns None.
+        """
+        connection = self.connection
+        if connection is not None and hasattr(connection, 'cancel_read'):
+            try:
+                connection.cancel_read()
+            except Exception as e:
+                self.logger.error(f"Cancel read error: {e}")
+    
     def is_connected(self) -> bool:
         """Check if RS232 connection is active"""
         return (self.connection is not None and 
@@ -255,8 +267,12 @@ class RS232Manager:
             
             return False
     
-    def read_data(self, timeout: Optional[float] = None) -> Optional[str]:
-        """Read data from RS232"""
+    def read_bytes(self, timeout: Optional[float] = None) -> Optional[bytes]:
+        """Read raw bytes from RS232, blocking up to timeout for the first byte
+        
+        Read failures (e.g. an unplugged adapter) are logged, counted and
+        re-raised so the caller can stop reading instead of retrying a dead port.
+        """
         
         if not self.is_connected():
             return None
@@ -267,22 +283,20 @@ class RS232Manager:
             if timeout is not None:
                 self.connection.timeout = timeout
             
-            # Check for available data
-            if self.connection.in_waiting > 0:
-                data = self.connection.read(self.connection.in_waiting)
-                self.stats['bytes_received'] += len(data)
-                
-                decoded_data = data.decode('ascii', errors='ignore')
-                self.logger.debug(f"Received {len(data)} bytes: {repr(decoded_data)}")
-                
-                if self.on_data_received:
-                    self.on_data_received(decoded_data)
-                
-                return decoded_data
+            try:
+                # Wait in the driver for data instead of polling in_waiting
+                data = self.connection.read(1)
+                if data and self.connection.in_waiting > 0:
+                    data += self.connection.read(self.connection.in_waiting)
+            finally:
+                # Restore original timeout
+                if timeout is not None:
+                    self.connection.timeout = original_timeout
             
-            # Restore original timeout
-            if timeout is not None:
-                self.connection.timeout = original_timeout
+            if data:
+                self.stats['bytes_received'] += len(data)
+                self.logger.debug("Received %d bytes: %r", len(data), data)
+                return data
             
         except Exception as e:
             self.logger.error(f"Read error: {e}")
@@ -290,9 +304,27 @@ class RS232Manager:
             
             if self.on_error:
                 self.on_error(f"Read error: {e}")
+            raise
         
         return None
     
+    def read_data(self, timeout: Optional[float] = None) -> Optional[str]:
+        """Read data from RS232 as text, blocking up to timeout for the first byte"""
+        
+        try:
+            data = self.read_bytes(timeout)
+        except Exception:
+            return None  # Already logged and counted by read_bytes
+        if not data:
+            return None
+        
+        decoded_data = data.decode('ascii', errors='ignore')
+        
+        if self.on_data_received:
+            self.on_data_received(decoded_data)
+        
+        return decoded_data
+    
     def flush_buffers(self):
         """Flush input and output buffers"""
         
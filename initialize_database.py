@@ -14,7 +14,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 def initialize_database():
     """Initialize the database with proper schema and test data"""
     try:
-        from database.data_access import DataAccessLayer
+        from database.data_access import get_data_access
         from core.config import DATABASE_PATH
         
         # Ensure database directory exists
@@ -23,7 +23,7 @@ def initialize_database():
         print(f"Initializing database at: {DATABASE_PATH}")
         
         # Create database connection
-        db = DataAccessLayer(str(DATABASE_PATH))
+        db = get_data_access(str(DATABASE_PATH))
         
         # Create tables if they don't exist
         with db.get_connection() as conn:
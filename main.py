@@ -14,7 +14,10 @@ This launcher starts the complete PyQt6 desktop application with:
 
 import sys
 import os
+import queue
+import atexit
 import logging
+import logging.handlers
 import argparse
 import time
 from pathlib import Path
@@ -27,14 +30,24 @@ sys.path.insert(0, str(Path(__file__).parent))
 logs_dir = Path('logs')
 logs_dir.mkdir(parents=True, exist_ok=True)
 
-# Setup logging
+# Setup logging: callers (including the serial worker thread) only enqueue
+# records; a listener thread does the formatting and file/console I/O
+log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+log_handlers = [
+    logging.FileHandler(logs_dir / 'scale_system.log'),
+    logging.StreamHandler()
+]
+for handler in log_handlers:
+    handler.setFormatter(log_formatter)
+
+log_queue = queue.Queue()
+log_listener = logging.handlers.QueueListener(log_queue, *log_handlers)
+log_listener.start()
+atexit.register(log_listener.stop)
+
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(logs_dir / 'scale_system.log'),
-        logging.StreamHandler()
-    ]
+    handlers=[logging.handlers.QueueHandler(log_queue)]
 )
 
 logger = logging.getLogger(__name__)
@@ -97,13 +110,13 @@ def check_system_setup():
     
     # Check database initialization
     try:
-        from database.data_access import DataAccessLayer
+        from database.data_access import get_data_access
         from core.config import DATABASE_PATH
         
         # Ensure database file can be created
         DATABASE_PATH.parent.mkdir(parents=True, exist_ok=True)
         
-        db = DataAccessLayer(str(DATABASE_PATH))
+        db = get_data_access(str(DATABASE_PATH))
         # Test database connection
         with db.get_connection() as conn:
             conn.execute("SELECT 1").fetchone()
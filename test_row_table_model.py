@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Test script to verify RowTableModel refreshes (prepend, identical, unrelated)
+"""
+
+import sys
+from pathlib import Path
+
+# Add system path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from ui.main_window import RowTableModel
+
+def watch(model):
+    """Record the structural signals a model emits"""
+    events = []
+    model.rowsInserted.connect(lambda parent, first, last: events.append(('insert', first, last)))
+    model.rowsRemoved.connect(lambda parent, first, last: events.append(('remove', first, last)))
+    model.modelReset.connect(lambda: events.append(('reset',)))
+    return events
+
+def make_model(rows):
+    model = RowTableModel(['Ticket', 'Vehicle'])
+    model.set_rows(rows)
+    return model
+
+def test_prepended_rows():
+    """New rows on top are inserted and rows pushed past the limit removed"""
+    model = make_model([('3', 'C'), ('2', 'B'), ('1', 'A')])
+    events = watch(model)
+
+    model.set_rows([('5', 'E'), ('4', 'D'), ('3', 'C')])
+
+    assert events == [('insert', 0, 1), ('remove', 3, 4)], events
+    assert model.rows == [('5', 'E'), ('4', 'D'), ('3', 'C')]
+    print("✅ Prepended rows inserted in place")
+
+def test_identical_rows():
+    """Setting the same rows emits nothing"""
+    model = make_model([('2', 'B'), ('1', 'A')])
+    events = watch(model)
+
+    model.set_rows([('2', 'B'), ('1', 'A')])
+
+    assert events == [], events
+    print("✅ Identical rows left untouched")
+
+def test_unrelated_rows():
+    """Rows that share nothing with the current ones reset the model"""
+    model = make_model([('2', 'B'), ('1', 'A')])
+    events = watch(model)
+
+    model.set_rows([('9', 'X'), ('8', 'Y')])
+
+    assert events == [('reset',)], events
+    assert model.rows == [('9', 'X'), ('8', 'Y')]
+    print("✅ Unrelated rows reset the model")
+
+def main():
+    """Run all tests"""
+
+    print("SCALE System RowTableModel Tests")
+    print("=" * 60)
+
+    try:
+        test_prepended_rows()
+        test_identical_rows()
+        test_unrelated_rows()
+        print("\n✅ All tests completed successfully!")
+
+    except Exception as e:
+        print(f"\n❌ Test execution failed: {e}")
+        return 1
+
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,2 @@
+# SCALE System user interface package
+# PyQt6 windows and dialogs
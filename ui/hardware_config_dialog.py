@@ -24,11 +24,12 @@ from PyQt6.QtGui import (
     QPainter, QBrush, QPen
 )
 
-# Import SCALE system components
-sys.path.append('..')
+# Import SCALE system components (run from the project root, e.g.
+# ``python -m ui.hardware_config_dialog``, so these resolve without sys.path edits)
 from hardware.rs232_manager import RS232Manager, RS232Config, RS232Status
 from hardware.hardware_config import HardwareProfileManager, SerialProfile
 from utils.helpers import format_timestamp
+from ui.styles import get_base_font
 
 class PortScanWorker(QThread):
     """Background thread for scanning RS232 ports"""
@@ -176,12 +177,12 @@ class HardwareConfigDialog(QDialog):
         self.setWindowTitle("Hardware Configuration - SCALE System")
         self.setFixedSize(800, 600)
         self.setModal(True)
+        self.setFont(get_base_font())
         
         # Apply modern styling
         self.setStyleSheet("""
             QDialog {
                 background-color: #f5f5f5;
-                font-family: 'Segoe UI', Arial, sans-serif;
             }
             QGroupBox {
                 font-weight: bold;
@@ -239,7 +240,7 @@ class HardwareConfigDialog(QDialog):
         
         # Title
         title_label = QLabel("Hardware Configuration")
-        title_font = QFont()
+        title_font = QFont(get_base_font())
         title_font.setPointSize(16)
         title_font.setBold(True)
         title_label.setFont(title_font)
@@ -788,10 +789,9 @@ Error: {test_result.get('error', 'None')}"""
     def load_profiles(self):
         """Load available hardware profiles"""
         
-        profiles = self.profile_manager.get_all_profiles()
         self.profile_combo.clear()
         
-        for name in profiles.keys():
+        for name in self.profile_manager.list_profiles():
             self.profile_combo.addItem(name)
     
     @pyqtSlot(str)
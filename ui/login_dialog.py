@@ -5,6 +5,7 @@ PIN-based authentication with modern UI design
 """
 
 import sys
+import time
 import logging
 from typing import Dict, Optional
 from datetime import datetime
@@ -16,17 +17,18 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import (
     Qt, QThread, pyqtSignal, QTimer, QSize,
-    pyqtSlot
+    pyqtSlot, QSignalBlocker, QMetaObject
 )
 from PyQt6.QtGui import (
     QFont, QIcon, QPalette, QColor, QPixmap,
-    QPainter, QBrush, QPen, QIntValidator
+    QPainter, QBrush, QPen
 )
 
-# Import SCALE system components
-sys.path.append('..')
+# Import SCALE system components (run from the project root, e.g.
+# ``python -m ui.login_dialog``, so these resolve without sys.path edits)
 from auth.auth_service import AuthenticationService
-from utils.helpers import format_timestamp
+from utils.helpers import format_timestamp, PIN_PATTERN
+from ui.styles import get_base_font
 
 class LoginAttemptWorker(QThread):
     """Background thread for login attempts to prevent UI blocking"""
@@ -47,7 +49,7 @@ class LoginAttemptWorker(QThread):
             if result['success']:
                 self.login_completed.emit(True, result)
             else:
-                self.login_completed.emit(False, {'error': result.get('error', 'Authentication failed')})
+                self.login_completed.emit(False, {'error': result.get('error', LoginDialog.DEFAULT_LOGIN_ERROR)})
                 
         except Exception as e:
             self.login_completed.emit(False, {'error': str(e)})
@@ -55,6 +57,14 @@ class LoginAttemptWorker(QThread):
 class LoginDialog(QDialog):
     """Enhanced login dialog with PIN authentication"""
     
+    login_succeeded = pyqtSignal(dict)  # Authenticated user data
+    
+    # Prebuilt messages for the generic failure, indexed by attempts remaining
+    DEFAULT_LOGIN_ERROR = 'Authentication failed'
+    REMAINING_ATTEMPTS_MESSAGES = tuple(
+        f"Authentication failed\nAttempts remaining: {i}" for i in range(4)
+    )
+    
     def __init__(self, auth_service: AuthenticationService, parent=None):
         super().__init__(parent)
         
@@ -62,20 +72,36 @@ class LoginDialog(QDialog):
         self.authenticated_user = None
         self.login_worker = None
         
+        # Trimmed input cache, kept current by textChanged
+        self.username_text = ""
+        self.pin_text = ""
+        
         # Login attempt tracking
         self.attempt_count = 0
         self.max_attempts = 3
-        self.lockout_timer = None
+        self.lockout_duration = 300  # 5 minutes in seconds
+        self.lockout_deadline = 0.0
         
+        # Single reusable 1 Hz countdown timer for lockouts
+        self.lockout_timer = QTimer(self)
+        self.lockout_timer.setInterval(1000)
+        self.lockout_timer.timeout.connect(self.tick_lockout)
+        
+        self.chrome_built = False
         self.setup_ui()
         self.setup_connections()
     
     def setup_ui(self):
-        """Setup the login dialog UI"""
+        """Setup the login dialog UI
+        
+        Only the widgets needed for authentication are built here; the
+        header, footer and stylesheet are deferred until the first show.
+        """
         
         self.setWindowTitle("SCALE System - Login")
         self.setFixedSize(400, 500)
         self.setModal(True)
+        self.setFont(get_base_font())
         
         # Remove window buttons and make it non-resizable
         self.setWindowFlags(
@@ -84,12 +110,97 @@ class LoginDialog(QDialog):
             Qt.WindowType.WindowTitleHint
         )
         
+        self.main_layout = QVBoxLayout()
+        self.main_layout.setSpacing(20)
+        
+        # Login form
+        login_group = QGroupBox("User Authentication")
+        login_layout = QVBoxLayout()
+        login_layout.setSpacing(15)
+        
+        # Username field
+        username_layout = QVBoxLayout()
+        username_layout.setSpacing(5)
+        
+        username_label = QLabel("Username:")
+        username_layout.addWidget(username_label)
+        
+        self.username_edit = QLineEdit()
+        self.username_edit.setPlaceholderText("Enter your username")
+        self.username_edit.returnPressed.connect(self.focus_pin_field)
+        self.username_edit.textChanged.connect(self.on_username_changed)
+        username_layout.addWidget(self.username_edit)
+        
+        login_layout.addLayout(username_layout)
+        
+        # PIN field
+        pin_layout = QVBoxLayout()
+        pin_layout.setSpacing(5)
+        
+        pin_label = QLabel("PIN:")
+        pin_layout.addWidget(pin_label)
+        
+        self.pin_edit = QLineEdit()
+        self.pin_edit.setEchoMode(QLineEdit.EchoMode.Password)
+        self.pin_edit.setPlaceholderText("Enter your PIN")
+        # Digits only, up to 6; length is checked against PIN_PATTERN on submit
+        self.pin_edit.setMaxLength(6)
+        self.pin_edit.setInputMask("000000")
+        self.pin_edit.returnPressed.connect(self.attempt_login)
+        self.pin_edit.textChanged.connect(self.on_pin_changed)
+        pin_layout.addWidget(self.pin_edit)
+        
+        login_layout.addLayout(pin_layout)
+        
+        # Show PIN checkbox
+        self.show_pin_check = QCheckBox("Show PIN")
+        self.show_pin_check.stateChanged.connect(self.toggle_pin_visibility)
+        login_layout.addWidget(self.show_pin_check)
+        
+        # Status/Error display
+        self.status_label = QLabel("")
+        self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.status_label.setWordWrap(True)
+        login_layout.addWidget(self.status_label)
+        
+        # Progress bar (hidden by default)
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setVisible(False)
+        login_layout.addWidget(self.progress_bar)
+        
+        login_group.setLayout(login_layout)
+        self.main_layout.addWidget(login_group)
+        
+        # Buttons
+        button_layout = QHBoxLayout()
+        button_layout.setSpacing(15)
+        
+        self.login_btn = QPushButton("Login")
+        self.login_btn.clicked.connect(self.attempt_login)
+        self.login_btn.setDefault(True)
+        
+        self.cancel_btn = QPushButton("Cancel")
+        self.cancel_btn.setProperty("class", "cancel")
+        self.cancel_btn.clicked.connect(self.reject)
+        
+        button_layout.addWidget(self.login_btn)
+        button_layout.addWidget(self.cancel_btn)
+        
+        self.main_layout.addLayout(button_layout)
+        
+        self.setLayout(self.main_layout)
+        
+        # Set focus to username field
+        self.username_edit.setFocus()
+    
+    def setup_chrome_ui(self):
+        """Build the decorative header, footer and stylesheet"""
+        
         # Apply professional styling
         self.setStyleSheet("""
             QDialog {
                 background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
                     stop:0 #f0f0f0, stop:1 #e0e0e0);
-                font-family: 'Segoe UI', Arial, sans-serif;
             }
             QGroupBox {
                 font-weight: bold;
@@ -170,9 +281,6 @@ class LoginDialog(QDialog):
             }
         """)
         
-        main_layout = QVBoxLayout()
-        main_layout.setSpacing(20)
-        
         # Header section
         header_frame = QFrame()
         header_layout = QVBoxLayout()
@@ -194,78 +302,7 @@ class LoginDialog(QDialog):
         header_layout.addWidget(version_label)
         
         header_frame.setLayout(header_layout)
-        main_layout.addWidget(header_frame)
-        
-        # Login form
-        login_group = QGroupBox("User Authentication")
-        login_layout = QVBoxLayout()
-        login_layout.setSpacing(15)
-        
-        # Username field
-        username_layout = QVBoxLayout()
-        username_layout.setSpacing(5)
-        
-        username_label = QLabel("Username:")
-        username_layout.addWidget(username_label)
-        
-        self.username_edit = QLineEdit()
-        self.username_edit.setPlaceholderText("Enter your username")
-        self.username_edit.returnPressed.connect(self.focus_pin_field)
-        username_layout.addWidget(self.username_edit)
-        
-        login_layout.addLayout(username_layout)
-        
-        # PIN field
-        pin_layout = QVBoxLayout()
-        pin_layout.setSpacing(5)
-        
-        pin_label = QLabel("PIN:")
-        pin_layout.addWidget(pin_label)
-        
-        self.pin_edit = QLineEdit()
-        self.pin_edit.setEchoMode(QLineEdit.EchoMode.Password)
-        self.pin_edit.setPlaceholderText("Enter your PIN")
-        self.pin_edit.setValidator(QIntValidator(1000, 999999))  # 4-6 digits
-        self.pin_edit.returnPressed.connect(self.attempt_login)
-        pin_layout.addWidget(self.pin_edit)
-        
-        login_layout.addLayout(pin_layout)
-        
-        # Show PIN checkbox
-        self.show_pin_check = QCheckBox("Show PIN")
-        self.show_pin_check.stateChanged.connect(self.toggle_pin_visibility)
-        login_layout.addWidget(self.show_pin_check)
-        
-        # Status/Error display
-        self.status_label = QLabel("")
-        self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.status_label.setWordWrap(True)
-        login_layout.addWidget(self.status_label)
-        
-        # Progress bar (hidden by default)
-        self.progress_bar = QProgressBar()
-        self.progress_bar.setVisible(False)
-        login_layout.addWidget(self.progress_bar)
-        
-        login_group.setLayout(login_layout)
-        main_layout.addWidget(login_group)
-        
-        # Buttons
-        button_layout = QHBoxLayout()
-        button_layout.setSpacing(15)
-        
-        self.login_btn = QPushButton("🔑 Login")
-        self.login_btn.clicked.connect(self.attempt_login)
-        self.login_btn.setDefault(True)
-        
-        self.cancel_btn = QPushButton("❌ Cancel")
-        self.cancel_btn.setProperty("class", "cancel")
-        self.cancel_btn.clicked.connect(self.reject)
-        
-        button_layout.addWidget(self.login_btn)
-        button_layout.addWidget(self.cancel_btn)
-        
-        main_layout.addLayout(button_layout)
+        self.main_layout.insertWidget(0, header_frame)
         
         # Footer with default accounts info
         footer_frame = QFrame()
@@ -286,12 +323,15 @@ class LoginDialog(QDialog):
         footer_layout.addWidget(accounts_label)
         
         footer_frame.setLayout(footer_layout)
-        main_layout.addWidget(footer_frame)
+        self.main_layout.addWidget(footer_frame)
         
-        self.setLayout(main_layout)
-        
-        # Set focus to username field
-        self.username_edit.setFocus()
+        self.chrome_built = True
+    
+    def showEvent(self, event):
+        """Build deferred UI chrome before the first paint"""
+        if not self.chrome_built:
+            self.setup_chrome_ui()
+        super().showEvent(event)
     
     def setup_connections(self):
         """Setup signal connections"""
@@ -302,6 +342,16 @@ class LoginDialog(QDialog):
         """Move focus to PIN field when Enter is pressed in username field"""
         self.pin_edit.setFocus()
     
+    @pyqtSlot(str)
+    def on_username_changed(self, text: str):
+        """Cache the trimmed username"""
+        self.username_text = text.strip()
+    
+    @pyqtSlot(str)
+    def on_pin_changed(self, text: str):
+        """Cache the trimmed PIN"""
+        self.pin_text = text.strip()
+    
     @pyqtSlot()
     def toggle_pin_visibility(self):
         """Toggle PIN field visibility"""
@@ -314,8 +364,8 @@ class LoginDialog(QDialog):
     def attempt_login(self):
         """Attempt to authenticate user"""
         
-        username = self.username_edit.text().strip()
-        pin = self.pin_edit.text().strip()
+        username = self.username_text
+        pin = self.pin_text
         
         # Validate input
         if not username:
@@ -328,8 +378,8 @@ class LoginDialog(QDialog):
             self.pin_edit.setFocus()
             return
         
-        if len(pin) < 4:
-            self.show_error("PIN must be at least 4 digits.")
+        if not PIN_PATTERN.match(pin):
+            self.show_error("PIN must be 4-6 digits.")
             self.pin_edit.setFocus()
             return
         
@@ -359,34 +409,41 @@ class LoginDialog(QDialog):
             self.authenticated_user = result['user']
             self.show_success(f"Welcome, {self.authenticated_user['username']}!")
             
-            # Short delay to show success message, then accept dialog
-            QTimer.singleShot(1000, self.accept)
+            # Accept immediately; the parent shows the welcome message
+            self.login_succeeded.emit(self.authenticated_user)
+            self.accept()
             
         else:
             self.attempt_count += 1
             remaining_attempts = self.max_attempts - self.attempt_count
             
-            error_msg = result.get('error', 'Authentication failed')
+            error_msg = result.get('error', self.DEFAULT_LOGIN_ERROR)
             
+            blocker = QSignalBlocker(self.status_label)
             if remaining_attempts > 0:
-                self.show_error(f"{error_msg}\nAttempts remaining: {remaining_attempts}")
+                if (error_msg == self.DEFAULT_LOGIN_ERROR and
+                        remaining_attempts < len(self.REMAINING_ATTEMPTS_MESSAGES)):
+                    self.show_error(self.REMAINING_ATTEMPTS_MESSAGES[remaining_attempts])
+                else:
+                    self.show_error(f"{error_msg}\nAttempts remaining: {remaining_attempts}")
             else:
                 self.show_error("Maximum login attempts exceeded. Access temporarily locked.")
                 self.start_lockout_timer()
+            blocker.unblock()
             
-            # Clear PIN field for security
-            self.pin_edit.clear()
-            self.pin_edit.setFocus()
+            # Clear PIN field for security once the status repaint is queued
+            QMetaObject.invokeMethod(self.pin_edit, "clear", Qt.ConnectionType.QueuedConnection)
+            QMetaObject.invokeMethod(self.pin_edit, "setFocus", Qt.ConnectionType.QueuedConnection)
     
     def show_error(self, message: str):
         """Display error message"""
-        self.status_label.setText(f"❌ {message}")
+        self.status_label.setText(message)
         self.status_label.setProperty("class", "error")
         self.status_label.style().polish(self.status_label)
     
     def show_success(self, message: str):
         """Display success message"""
-        self.status_label.setText(f"✅ {message}")
+        self.status_label.setText(message)
         self.status_label.setProperty("class", "success")
         self.status_label.style().polish(self.status_label)
     
@@ -405,34 +462,44 @@ class LoginDialog(QDialog):
     
     def set_ui_enabled(self, enabled: bool):
         """Enable/disable UI elements during login attempt"""
-        self.username_edit.setEnabled(enabled)
-        self.pin_edit.setEnabled(enabled)
-        self.login_btn.setEnabled(enabled)
-        self.show_pin_check.setEnabled(enabled)
+        # Batch the state change into a single repaint pass
+        self.setUpdatesEnabled(False)
+        try:
+            for widget in (self.username_edit, self.pin_edit,
+                           self.login_btn, self.show_pin_check):
+                blocker = QSignalBlocker(widget)
+                widget.setEnabled(enabled)
+                blocker.unblock()
+        finally:
+            self.setUpdatesEnabled(True)
     
     def start_lockout_timer(self):
         """Start lockout timer after max attempts"""
-        lockout_duration = 300000  # 5 minutes in milliseconds
-        
         self.set_ui_enabled(False)
         
-        self.lockout_timer = QTimer()
-        self.lockout_timer.timeout.connect(self.end_lockout)
-        self.lockout_timer.start(lockout_duration)
+        self.lockout_deadline = time.monotonic() + self.lockout_duration
+        self.lockout_timer.start()
         
         # Show countdown
-        self.show_lockout_countdown(lockout_duration)
+        self.show_lockout_countdown(self.lockout_duration)
+    
+    @pyqtSlot()
+    def tick_lockout(self):
+        """Update the lockout countdown once per second"""
+        remaining = self.lockout_deadline - time.monotonic()
+        if remaining <= 0:
+            self.end_lockout()
+        else:
+            self.show_lockout_countdown(remaining)
     
-    def show_lockout_countdown(self, duration_ms: int):
+    def show_lockout_countdown(self, remaining_s: float):
         """Show lockout countdown"""
-        minutes = duration_ms // 60000
-        self.show_error(f"Account locked for {minutes} minutes due to failed login attempts.")
+        minutes, seconds = divmod(int(remaining_s + 0.5), 60)
+        self.show_error(f"Account locked for {minutes:d}:{seconds:02d} due to failed login attempts.")
     
     def end_lockout(self):
         """End lockout period"""
-        if self.lockout_timer:
-            self.lockout_timer.stop()
-            self.lockout_timer = None
+        self.lockout_timer.stop()
         
         self.attempt_count = 0
         self.set_ui_enabled(True)
@@ -462,8 +529,7 @@ class LoginDialog(QDialog):
             self.login_worker.quit()
             self.login_worker.wait()
         
-        if self.lockout_timer:
-            self.lockout_timer.stop()
+        self.lockout_timer.stop()
         
         event.accept()
 
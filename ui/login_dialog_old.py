@@ -1,29 +1,137 @@
 # Login dialog UI component
-import sys
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, 
-    QPushButton, QMessageBox, QFrame, QApplication, QSpacerItem,
-    QSizePolicy, QGridLayout, QCheckBox
+    QPushButton, QMessageBox, QFrame, QApplication,
+    QSizePolicy, QFormLayout, QCheckBox
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
-from PyQt6.QtGui import QFont, QPixmap, QIcon
-from datetime import datetime
-from typing import Optional, Dict, Any
+from PyQt6.QtCore import (
+    Qt, QTimer, QThread, QObject, QSize, pyqtSignal, pyqtSlot, QRegularExpression
+)
+from PyQt6.QtGui import QFont, QRegularExpressionValidator
+from typing import Optional, Dict, Any, TYPE_CHECKING
+
+# Auth and database modules are imported lazily by DatabaseInitWorker so the
+# dialog can paint before sqlite and the auth package are loaded
+if TYPE_CHECKING:
+    from auth.session_manager import SessionManager
 
-from auth.login_manager import LoginManager
-from auth.session_manager import SessionManager
-from database.data_access import DataAccessLayer
+# Same rules as utils.helpers.validate_username/validate_pin. The field
+# validators already restrict the characters and maximum lengths, so only the
+# minimum lengths are left to check on submit
+MIN_USERNAME_LENGTH = 3
+MIN_PIN_LENGTH = 4
+
+class DatabaseInitWorker(QThread):
+    """Background thread that opens the database so the dialog never blocks on I/O"""
+    
+    database_ready = pyqtSignal(object, object, object)  # db_manager, login_manager, session_manager
+    database_failed = pyqtSignal(str)                    # Error message
+    
+    def __init__(self, db_path: str):
+        super().__init__()
+        self.db_path = db_path
+    
+    def run(self):
+        """Import the auth/database modules and open the database"""
+        try:
+            from auth.login_manager import LoginManager
+            from auth.session_manager import SessionManager
+            from database.data_access import get_data_access
+            
+            db_manager = get_data_access(self.db_path)
+            self.database_ready.emit(db_manager, LoginManager(db_manager), SessionManager())
+        except Exception as e:
+            self.database_failed.emit(str(e))
+
+class LoginWorker(QObject):
+    """Login worker living on one QThread for the lifetime of the dialog
+    
+    Every attempt runs on the same thread, so they share its thread-local
+    database connection and prepared statements.
+    """
+    
+    login_completed = pyqtSignal(bool, dict)  # Success, result info
+    
+    def __init__(self):
+        super().__init__()
+        self.login_manager = None  # Set once the database is open
+    
+    @pyqtSlot(str, str, object)
+    def authenticate(self, username: str, pin: str,
+                     user_record: Optional[Dict[str, Any]] = None):
+        """Look up the user (unless cached) and verify the PIN"""
+        result = {'username': username, 'user_record': user_record}
+        try:
+            if result['user_record'] is None:
+                result['user_record'] = self.login_manager.get_user_by_username(username)
+            
+            user_info = self.login_manager.authenticate_user(
+                username, pin, user=result['user_record']
+            )
+            result['user'] = user_info
+            self.login_completed.emit(bool(user_info), result)
+            
+        except Exception as e:
+            result['error'] = str(e)
+            self.login_completed.emit(False, result)
 
 class LoginDialog(QDialog):
     """Login dialog for user authentication"""
     
     login_successful = pyqtSignal(dict)  # Emitted when login succeeds
+    login_requested = pyqtSignal(str, str, object)  # Username, PIN, cached user record
+    
+    DIALOG_SIZE = QSize(400, 300)
+    
+    # Status label style, applied once; states switch via the "state" property
+    STATUS_QSS = """
+        QLabel { color: #666666; font-size: 9pt; }
+        QLabel[state="error"] { color: #cc0000; font-weight: bold; }
+        QLabel[state="ok"] { color: #008000; font-weight: bold; }
+    """
+    SUBTITLE_QSS = "color: #666666;"
+    
+    # Error message templates
+    ERR_DB_INIT = "Failed to initialize database: %s\n\nPlease check database connection."
+    ERR_LOGIN = "Login error: %s"
+    
+    # Delay after the n-th failed attempt is BACKOFF_BASE_MS * 2**n
+    BACKOFF_BASE_MS = 250
+    
+    # Header fonts, shared by all instances (built on first use since QFont
+    # needs a QApplication)
+    title_font = None
+    subtitle_font = None
+    
+    @classmethod
+    def init_fonts(cls):
+        """Build the shared header fonts once"""
+        if cls.title_font is None:
+            cls.title_font = QFont()
+            cls.title_font.setPointSize(18)
+            cls.title_font.setBold(True)
+            
+            cls.subtitle_font = QFont()
+            cls.subtitle_font.setPointSize(10)
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.db_manager = None
         self.login_manager = None
-        self.session_manager = SessionManager()
+        self.session_manager = None
+        self.user_info = None
+        self.closing_confirmed = False
+        self.db_worker = None
+        
+        # One login thread reused for every attempt
+        self.login_thread = QThread(self)
+        self.login_worker = LoginWorker()
+        self.login_worker.moveToThread(self.login_thread)
+        self.login_worker.login_completed.connect(self.on_login_completed)
+        self.login_requested.connect(self.login_worker.authenticate)
+        self.login_thread.start()
+        self.attempt_blocked = False
+        self.user_record_cache: Dict[str, Dict[str, Any]] = {}  # username -> user record
         self.login_attempts = 0
         self.max_attempts = 3
         
@@ -31,23 +139,39 @@ class LoginDialog(QDialog):
         self.init_database()
         
     def init_database(self):
-        """Initialize database connection"""
-        try:
-            self.db_manager = DataAccessLayer("scale_system/data/scale_system.db")
-            self.login_manager = LoginManager(self.db_manager)
-        except Exception as e:
-            QMessageBox.critical(
-                self, 
-                "Database Error", 
-                f"Failed to initialize database: {str(e)}\n\nPlease check database connection."
-            )
-            self.reject()
+        """Open the database connection in the background"""
+        self.login_button.setEnabled(False)
+        self.login_button.setText("Connecting...")
+        
+        self.db_worker = DatabaseInitWorker("scale_system/data/scale_system.db")
+        self.db_worker.database_ready.connect(self.on_database_ready)
+        self.db_worker.database_failed.connect(self.on_database_failed)
+        self.db_worker.start()
+    
+    def on_database_ready(self, db_manager, login_manager, session_manager):
+        """Store the opened database services and allow login"""
+        self.db_manager = db_manager
+        self.login_manager = login_manager
+        self.session_manager = session_manager
+        self.login_worker.login_manager = login_manager
+        
+        self.login_button.setText("Login")
+        self.login_button.setEnabled(True)
+    
+    def on_database_failed(self, error: str):
+        """Report a database initialization failure and close"""
+        QMessageBox.critical(
+            self, 
+            "Database Error", 
+            self.ERR_DB_INIT % error
+        )
+        self.reject()
     
     def init_ui(self):
         """Initialize the user interface"""
         self.setWindowTitle("SCALE System - Login")
         self.setModal(True)
-        self.setFixedSize(400, 300)
+        self.setFixedSize(self.DIALOG_SIZE)
         
         # Set window flags to prevent closing
         self.setWindowFlags(
@@ -82,23 +206,21 @@ class LoginDialog(QDialog):
         """Create header section with logo and title"""
         header_frame = QFrame()
         header_frame.setFrameStyle(QFrame.Shape.Box)
+        header_frame.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
         header_layout = QVBoxLayout(header_frame)
         
+        self.init_fonts()
+        
         # Title
         title_label = QLabel("SCALE System")
-        title_font = QFont()
-        title_font.setPointSize(18)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
+        title_label.setFont(self.title_font)
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         # Subtitle
         subtitle_label = QLabel("Weighbridge Management System v2.0")
-        subtitle_font = QFont()
-        subtitle_font.setPointSize(10)
-        subtitle_label.setFont(subtitle_font)
+        subtitle_label.setFont(self.subtitle_font)
         subtitle_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        subtitle_label.setStyleSheet("color: #666666;")
+        subtitle_label.setStyleSheet(self.SUBTITLE_QSS)
         
         header_layout.addWidget(title_label)
         header_layout.addWidget(subtitle_label)
@@ -108,20 +230,25 @@ class LoginDialog(QDialog):
     def create_form(self, layout: QVBoxLayout):
         """Create login form"""
         form_frame = QFrame()
-        form_layout = QGridLayout(form_frame)
+        form_frame.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
+        form_layout = QFormLayout(form_frame)
         form_layout.setSpacing(10)
         
         # Username field
-        username_label = QLabel("Username:")
         self.username_edit = QLineEdit()
         self.username_edit.setPlaceholderText("Enter your username")
+        self.username_edit.setValidator(
+            QRegularExpressionValidator(QRegularExpression(r"[A-Za-z0-9_]{0,20}"), self)
+        )
         self.username_edit.returnPressed.connect(self.on_username_enter)
         
         # PIN field
-        pin_label = QLabel("PIN:")
         self.pin_edit = QLineEdit()
         self.pin_edit.setEchoMode(QLineEdit.EchoMode.Password)
         self.pin_edit.setPlaceholderText("Enter your PIN")
+        self.pin_edit.setValidator(
+            QRegularExpressionValidator(QRegularExpression(r"[0-9]{0,6}"), self)
+        )
         self.pin_edit.returnPressed.connect(self.attempt_login)
         
         # Show PIN checkbox
@@ -129,11 +256,9 @@ class LoginDialog(QDialog):
         self.show_pin_checkbox.stateChanged.connect(self.toggle_pin_visibility)
         
         # Add to form
-        form_layout.addWidget(username_label, 0, 0)
-        form_layout.addWidget(self.username_edit, 0, 1)
-        form_layout.addWidget(pin_label, 1, 0)
-        form_layout.addWidget(self.pin_edit, 1, 1)
-        form_layout.addWidget(self.show_pin_checkbox, 2, 1)
+        form_layout.addRow("Username:", self.username_edit)
+        form_layout.addRow("PIN:", self.pin_edit)
+        form_layout.addRow("", self.show_pin_checkbox)
         
         layout.addWidget(form_frame)
         
@@ -158,9 +283,8 @@ class LoginDialog(QDialog):
     def create_status_bar(self, layout: QVBoxLayout):
         """Create status bar"""
         self.status_label = QLabel("Please enter your credentials")
-        self.status_label.setStyleSheet(
-            "QLabel { color: #666666; font-size: 9pt; }"
-        )
+        self.status_label.setProperty("state", "")
+        self.status_label.setStyleSheet(self.STATUS_QSS)
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         layout.addWidget(self.status_label)
@@ -178,8 +302,11 @@ class LoginDialog(QDialog):
             
     def attempt_login(self):
         """Attempt to log in with provided credentials"""
+        if self.attempt_blocked:
+            return  # Previous attempt still in progress or backing off
+            
         username = self.username_edit.text().strip()
-        pin = self.pin_edit.text().strip()
+        pin = self.pin_edit.text()  # PINs have no whitespace semantics
         
         # Basic validation
         if not username:
@@ -192,29 +319,56 @@ class LoginDialog(QDialog):
             self.pin_edit.setFocus()
             return
             
+        if len(username) < MIN_USERNAME_LENGTH or len(pin) < MIN_PIN_LENGTH:
+            # Counts as a failed attempt, same as a wrong PIN, and still pays
+            # for one PIN check so it is not rejected measurably faster
+            if self.login_manager is not None:
+                self.login_manager.verify_dummy_pin(pin)
+            self.attempt_blocked = True
+            self.login_button.setEnabled(False)
+            self.on_login_completed(False, {'username': username})
+            return
+            
+        if self.login_manager is None:
+            self.show_error("Still connecting to the database, please wait")
+            return
+            
         # Disable login button during authentication
+        self.attempt_blocked = True
         self.login_button.setEnabled(False)
         self.status_label.setText("Authenticating...")
-        QApplication.processEvents()
         
+        # Authenticate in the background, reusing the user record across
+        # PIN retries for the same username
+        self.login_requested.emit(username, pin, self.user_record_cache.get(username))
+        
+    def on_login_completed(self, success: bool, result: Dict[str, Any]):
+        """Handle the result of a background login attempt"""
+        backoff_ms = 0
         try:
-            # Attempt authentication
-            user_info = self.login_manager.authenticate_user(username, pin)
+            if result.get('user_record'):
+                self.user_record_cache[result['username']] = result['user_record']
             
-            if user_info:
+            if 'error' in result:
+                self.show_error(self.ERR_LOGIN % result['error'])
+                
+            elif success:
                 # Authentication successful
+                user_info = result['user']
+                self.user_info = user_info
+                self.user_record_cache.clear()
                 session = self.session_manager.create_session(user_info)
                 self.show_success(f"Welcome, {user_info['username']}!")
                 
-                # Emit success signal with user info
+                # Emit success signal with user info, then close right away;
+                # the caller is responsible for any welcome message
                 self.login_successful.emit(user_info)
-                
-                # Close dialog after short delay
-                QTimer.singleShot(1000, self.accept)
+                self.accept()
                 
             else:
-                # Authentication failed
+                # Authentication failed; back off before the next attempt
                 self.login_attempts += 1
+                backoff_ms = self.BACKOFF_BASE_MS * (1 << self.login_attempts)
                 remaining = self.max_attempts - self.login_attempts
                 
                 if remaining > 0:
@@ -224,32 +378,43 @@ class LoginDialog(QDialog):
                     self.clear_form()
                 else:
                     self.show_error("Too many failed attempts. Application will exit.")
+                    self.closing_confirmed = True
                     QTimer.singleShot(2000, self.reject)
                     
         except Exception as e:
-            self.show_error(f"Login error: {str(e)}")
+            self.show_error(self.ERR_LOGIN % e)
             
         finally:
-            self.login_button.setEnabled(True)
+            if backoff_ms:
+                QTimer.singleShot(backoff_ms, self.allow_next_attempt)
+            else:
+                self.allow_next_attempt()
+            
+    def allow_next_attempt(self):
+        """Allow the next login attempt"""
+        self.attempt_blocked = False
+        self.login_button.setEnabled(True)
             
     def clear_form(self):
         """Clear the login form"""
         self.pin_edit.clear()
         self.username_edit.setFocus()
         
+    def set_status_state(self, state: str):
+        """Restyle the status label by switching its state property"""
+        self.status_label.setProperty("state", state)
+        self.status_label.style().unpolish(self.status_label)
+        self.status_label.style().polish(self.status_label)
+        
     def show_error(self, message: str):
         """Show error message"""
+        self.set_status_state("error")
         self.status_label.setText(message)
-        self.status_label.setStyleSheet(
-            "QLabel { color: #cc0000; font-size: 9pt; font-weight: bold; }"
-        )
         
     def show_success(self, message: str):
         """Show success message"""
+        self.set_status_state("ok")
         self.status_label.setText(message)
-        self.status_label.setStyleSheet(
-            "QLabel { color: #008000; font-size: 9pt; font-weight: bold; }"
-        )
         
     def confirm_exit(self):
         """Confirm application exit"""
@@ -262,15 +427,42 @@ class LoginDialog(QDialog):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
+            self.closing_confirmed = True
             self.reject()
             
     def closeEvent(self, event):
         """Handle dialog close event"""
         # Prevent closing without proper authentication or exit confirmation
+        if self.closing_confirmed or self.result() == QDialog.DialogCode.Accepted:
+            self.stop_threads()
+            event.accept()
+            return
+            
         event.ignore()
         self.confirm_exit()
         
-    def get_session_manager(self) -> SessionManager:
+    def done(self, result: int):
+        """Stop the background threads whenever the dialog finishes"""
+        self.stop_threads()
+        super().done(result)
+        
+    def stop_threads(self):
+        """Let a running database open or login attempt finish, then end the threads
+        
+        The dialog may be torn down right after this, and a QThread destroyed
+        while run() is still executing aborts the application.
+        """
+        if self.db_worker is not None and self.db_worker.isRunning():
+            self.db_worker.wait()
+        if self.login_thread.isRunning():
+            self.login_thread.quit()
+            self.login_thread.wait()
+        
+    def get_user_info(self) -> Optional[Dict[str, Any]]:
+        """Get the authenticated user info after a successful login"""
+        return self.user_info
+        
+    def get_session_manager(self) -> 'SessionManager':
         """Get the session manager for the main application"""
         return self.session_manager
 
@@ -279,20 +471,14 @@ def show_login_dialog(parent=None) -> Optional[Dict[str, Any]]:
     """Show login dialog and return user info if successful"""
     dialog = LoginDialog(parent)
     
-    user_info = None
-    
-    def on_login_success(info):
-        nonlocal user_info
-        user_info = info
-        
-    dialog.login_successful.connect(on_login_success)
-    
     if dialog.exec() == QDialog.DialogCode.Accepted:
-        return user_info, dialog.get_session_manager()
+        return dialog.get_user_info(), dialog.get_session_manager()
     
     return None, None
 
 if __name__ == "__main__":
+    import sys
+    
     # Test the login dialog
     app = QApplication(sys.argv)
     
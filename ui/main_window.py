@@ -4,151 +4,602 @@ SCALE System Main Application Window
 Complete PyQt6 desktop application for weighbridge management
 """
 
+import re
 import sys
+import time
 import logging
+from collections import deque
+from functools import partial
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, 
     QGridLayout, QWidget, QLabel, QPushButton, QGroupBox,
-    QTextEdit, QTableWidget, QTableWidgetItem, QTabWidget,
+    QTextEdit, QPlainTextEdit, QTabWidget,
     QFrame, QSplitter, QStatusBar, QMenuBar, QToolBar,
-    QMessageBox, QDialog, QProgressBar, QComboBox,
+    QMessageBox, QDialog, QProgressBar, QProgressDialog, QComboBox,
     QLineEdit, QSpinBox, QCheckBox, QDateEdit, QTimeEdit,
-    QHeaderView, QAbstractItemView, QScrollArea, QFileDialog
+    QHeaderView, QAbstractItemView, QScrollArea, QFileDialog, QTableView
 )
 from PyQt6.QtCore import (
-    Qt, QThread, pyqtSignal, QTimer, QSize, QRect,
-    pyqtSlot, QDate, QTime, QDateTime
+    Qt, QObject, QThread, QThreadPool, QRunnable, pyqtSignal, QTimer,
+    QSize, QRect, pyqtSlot, QDate, QTime, QDateTime, QMutex,
+    QAbstractTableModel, QModelIndex, QSortFilterProxyModel, QEvent,
+    QSignalBlocker
 )
 from PyQt6.QtGui import (
     QFont, QIcon, QPalette, QColor, QPixmap, QAction,
     QPainter, QBrush, QPen, QScreen
 )
 
-# Import SCALE system components
-sys.path.append('..')
+# Import SCALE system components (run from the project root, e.g.
+# ``python -m ui.main_window``, so these resolve without sys.path edits)
 from auth.auth_service import AuthenticationService
 from weighing.workflow_controller import WorkflowController, WorkflowState
-from database.data_access import DataAccessLayer
+from database.data_access import DataAccessLayer, get_data_access
 from hardware.rs232_manager import RS232Manager, RS232Config
 from ui.hardware_config_dialog import HardwareConfigDialog
 from ui.login_dialog import LoginDialog
 from ui.master_data_management import MasterDataDialog
 from utils.helpers import (
     format_timestamp, format_weight, generate_uuid, 
-    export_to_csv, export_to_json, format_file_size
+    export_to_csv, export_rows_to_json, format_file_size
 )
 from core.config import DATABASE_PATH
 import os
 from pathlib import Path
 
-class WeightDisplayWorker(QThread):
-    """Background thread for real-time weight monitoring"""
+logger = logging.getLogger(__name__)
+
+# Weight frame parsing on raw serial bytes, compiled once
+WEIGHT_PATTERN = re.compile(rb'([+-]?\d+\.?\d*)')
+FRAME_DELIMITER = re.compile(rb'[\r\n]+')
+
+# Main window stylesheet, built once at import
+MAIN_WINDOW_QSS = """
+    QMainWindow {
+        background-color: #f5f5f5;
+        font-family: 'Segoe UI', Arial, sans-serif;
+    }
+    QGroupBox {
+        font-weight: bold;
+        border: 2px solid #cccccc;
+        border-radius: 8px;
+        margin-top: 10px;
+        padding-top: 15px;
+        background-color: white;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 20px;
+        padding: 0 10px 0 10px;
+        background-color: #f5f5f5;
+    }
+    QPushButton {
+        background-color: #0078d4;
+        color: white;
+        border: none;
+        padding: 8px 16px;
+        border-radius: 4px;
+        font-weight: bold;
+        min-width: 80px;
+    }
+    QPushButton:hover {
+        background-color: #106ebe;
+    }
+    QPushButton:pressed {
+        background-color: #005a9e;
+    }
+    QPushButton:disabled {
+        background-color: #cccccc;
+        color: #666666;
+    }
+    QPushButton.success {
+        background-color: #107c10;
+    }
+    QPushButton.success:hover {
+        background-color: #0e6b0e;
+    }
+    QPushButton.warning {
+        background-color: #ff8c00;
+    }
+    QPushButton.warning:hover {
+        background-color: #e67a00;
+    }
+    QPushButton.danger {
+        background-color: #d83b01;
+    }
+    QPushButton.danger:hover {
+        background-color: #c33400;
+    }
+    QLineEdit, QComboBox {
+        padding: 6px;
+        border: 1px solid #cccccc;
+        border-radius: 4px;
+        background-color: white;
+    }
+    QTableView {
+        gridline-color: #e1e1e1;
+        selection-background-color: #0078d4;
+    }
+    QTableView::item {
+        padding: 8px;
+    }
+    QTabWidget::pane {
+        border: 1px solid #cccccc;
+        background-color: white;
+    }
+    QTabBar::tab {
+        background-color: #e1e1e1;
+        padding: 8px 16px;
+        margin-right: 2px;
+        border-top-left-radius: 4px;
+        border-top-right-radius: 4px;
+    }
+    QTabBar::tab:selected {
+        background-color: #0078d4;
+        color: white;
+    }
+    QLabel#weightDisplay {
+        background-color: #1e1e1e;
+        color: #00ff00;
+        border: 2px solid #333333;
+        border-radius: 8px;
+        padding: 20px;
+        margin: 10px;
+    }
+    QLabel#weightDisplay[stable="true"] {
+        border-color: #00ff00;
+    }
+    QLabel#weightDisplay[stable="false"] {
+        color: #ffff00;
+        border-color: #ffaa00;
+    }
+    QLabel#connectionInfo {
+        font-weight: bold;
+        color: #ff6600;
+    }
+    QLabel#connectionInfo[connected="true"] {
+        color: #10b010;
+    }
+    QLabel#consoleStatus {
+        font-weight: bold;
+        color: red;
+    }
+    QLabel#consoleStatus[connected="true"] {
+        color: green;
+    }
+    QLabel#infoNote, QLabel#recordingFile {
+        color: #666;
+        font-style: italic;
+    }
+    QLabel#recordingFile[recording="true"] {
+        color: green;
+        font-style: normal;
+        font-weight: bold;
+    }
+    QPlainTextEdit#serialConsole {
+        background-color: #1e1e1e;
+        color: #00ff00;
+        border: 1px solid #333;
+    }
+"""
+
+# Keyboard shortcuts help text shown by the F1 dialog
+SHORTCUTS_HTML = """
+<b>SCALE System Keyboard Shortcuts</b><br><br>
+
+<b>File Operations:</b><br>
+Ctrl+N - New Transaction<br>
+Ctrl+Q - Exit Application<br><br>
+
+<b>Weighing Operations:</b><br>
+F2 - Timbang I (First Weigh)<br>
+F3 - Timbang II (Second Weigh)<br>
+F4 - New Transaction<br>
+Ctrl+S - Save Transaction<br><br>
+
+<b>Hardware & Tools:</b><br>
+F5 - Refresh/Reconnect Hardware<br>
+Ctrl+E - Export Transactions<br><br>
+
+<b>Help:</b><br>
+F1 - Show This Help Dialog<br><br>
+
+<i>💡 Tip: Most buttons also show their shortcuts in tooltips.</i>
+"""
+
+
+def set_style_state(widget: QWidget, name: str, value):
+    """Set a dynamic property used by MAIN_WINDOW_QSS and re-polish the widget"""
+    widget.setProperty(name, value)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+
+class WeightWorker(QObject):
+    """Weight monitoring worker living on a long-lived QThread
     
-    weight_updated = pyqtSignal(dict)  # Weight data
+    start_loop/stop_loop arrive as queued calls, so one thread serves every
+    connect/disconnect cycle. Each read is its own event-loop iteration,
+    which keeps the thread responsive to the next queued stop_loop.
+    """
+    
+    weight_updated = pyqtSignal(dict)  # Weight data, on meaningful change or heartbeat
     connection_status = pyqtSignal(str, bool)  # Status message, connected
     
-    def __init__(self, rs232_config=None):
+    WEIGHT_DECIMALS = 2  # Readings that differ at this precision are a change
+    HEARTBEAT_INTERVAL = 0.5  # Re-emit an unchanged reading this often (seconds)
+    READ_TIMEOUT = 1.0  # Upper bound on a blocking read; stops cancel it early
+    MAX_FRAME_BYTES = 1024  # Unterminated input beyond this is discarded
+    
+    def __init__(self):
         super().__init__()
         self.rs232_manager = RS232Manager()
-        self.config = rs232_config
+        self.config = None
         self.running = False
         self.connected = False
-    
-    def start_monitoring(self, config: RS232Config):
-        """Start weight monitoring with given configuration"""
+        self.frames_mutex = QMutex()
+        self.pending_frames = []  # Every parsed frame not yet taken by the UI
+        self.last_emitted = None
+        self.last_emit_time = 0.0
+        self.buffer = bytearray()
+    
+    @pyqtSlot(object)
+    def start_loop(self, config: RS232Config):
+        """Connect with the given configuration and start reading"""
+        self.stop_loop()
         self.config = config
+        self.last_emitted = None
+        self.last_emit_time = 0.0
+        self.buffer.clear()
+        
+        if not self.rs232_manager.connect(config):
+            self.connection_status.emit(f"Failed to connect to {config.port}", False)
+            return
+        
+        self.connected = True
         self.running = True
-        self.start()
+        self.connection_status.emit(f"Connected to {config.port} at {config.baud_rate} baud", True)
+        QTimer.singleShot(0, self.read_once)
     
-    def stop_monitoring(self):
-        """Stop weight monitoring"""
+    @pyqtSlot()
+    def stop_loop(self):
+        """Stop reading and release the serial port"""
         self.running = False
         if self.connected:
             self.rs232_manager.disconnect()
-        self.quit()
-        self.wait()
+            self.connected = False
     
-    def run(self):
-        """Main monitoring loop"""
-        if not self.config:
-            return
+    def interrupt_read(self):
+        """Stop rescheduling reads and wake a blocked one (called from the UI thread)
         
-        # Attempt connection
-        if self.rs232_manager.connect(self.config):
-            self.connected = True
-            self.connection_status.emit(f"Connected to {self.config.port} at {self.config.baud_rate} baud", True)
-            
-            while self.running and self.connected:
-                try:
-                    # Read weight data
-                    data = self.rs232_manager.read_data(timeout=1.0)
-                    
-                    if data:
-                        # Parse weight data (simplified)
-                        weight_data = self._parse_weight_data(data)
-                        if weight_data:
-                            self.weight_updated.emit(weight_data)
-                    
-                    self.msleep(100)  # Check every 100ms
-                    
-                except Exception as e:
-                    self.connection_status.emit(f"Communication error: {str(e)}", False)
-                    break
-            
-            self.rs232_manager.disconnect()
-            self.connected = False
-        else:
-            self.connection_status.emit(f"Failed to connect to {self.config.port}", False)
+        This lets a queued start_loop/stop_loop run without waiting out
+        READ_TIMEOUT.
+        """
+        self.running = False
+        self.rs232_manager.cancel_read()
     
-    def _parse_weight_data(self, raw_data: str) -> Optional[Dict]:
-        """Parse raw weight data into structured format"""
+    def take_frames(self) -> List[Dict]:
+        """Return every parsed frame since the last call, oldest first"""
+        self.frames_mutex.lock()
         try:
-            # Simple parsing - in real implementation, use the protocol parser
-            import re
-            
-            # Look for weight pattern
-            weight_match = re.search(r'([+-]?\d+\.?\d*)', raw_data.strip())
-            if weight_match:
-                weight = float(weight_match.group(1))
-                
-                # Determine stability (simple heuristic)
-                stable = 'ST' in raw_data.upper() or 'STABLE' in raw_data.upper()
-                
-                # Determine unit
-                unit = 'KG'
-                if 'LB' in raw_data.upper():
-                    unit = 'LB'
-                elif ' G' in raw_data.upper():
-                    unit = 'G'
+            frames, self.pending_frames = self.pending_frames, []
+        finally:
+            self.frames_mutex.unlock()
+        return frames
+    
+    @pyqtSlot()
+    def read_once(self):
+        """Read one chunk, then reschedule while monitoring is active"""
+        if not (self.running and self.connected):
+            return
+        
+        # read_bytes returns at once on a closed port, so rescheduling would spin
+        if not self.rs232_manager.is_connected():
+            self.connection_status.emit("Connection lost", False)
+            self.stop_loop()
+            return
+        
+        try:
+            # Blocks in the driver until bytes arrive, the timeout expires
+            # or interrupt_read() cancels it; read errors end monitoring below
+            data = self.rs232_manager.read_bytes(timeout=self.READ_TIMEOUT)
+            
+            if data:
+                # Split complete CR/LF-terminated frames off the byte buffer
+                self.buffer += data
+                *frames, rest = FRAME_DELIMITER.split(self.buffer)
+                if len(rest) > self.MAX_FRAME_BYTES:
+                    logger.warning("Discarding %d bytes without a frame terminator", len(rest))
+                    rest = b''
+                self.buffer[:] = rest
                 
-                return {
-                    'weight': weight,
-                    'stable': stable,
-                    'unit': unit,
-                    'timestamp': datetime.now().isoformat(),
-                    'raw_data': raw_data.strip()
-                }
+                for frame in frames:
+                    # Parse weight data (simplified)
+                    weight_data = self._parse_weight_data(frame)
+                    if weight_data:
+                        self._store_frame(weight_data)
+            
         except Exception as e:
-            print(f"Weight parsing error: {e}")
+            self.connection_status.emit(f"Communication error: {str(e)}", False)
+            self.stop_loop()
+            return
         
+        QTimer.singleShot(0, self.read_once)
+    
+    def _store_frame(self, weight_data: Dict):
+        """Queue the frame for the UI and signal only real changes"""
+        self.frames_mutex.lock()
+        try:
+            self.pending_frames.append(weight_data)
+        finally:
+            self.frames_mutex.unlock()
+        
+        # An unchanged reading is still re-sent now and then as a heartbeat
+        last = self.last_emitted
+        now = time.monotonic()
+        if (last is None
+                or weight_data['stable'] != last['stable']
+                or weight_data['unit'] != last['unit']
+                or (round(weight_data['weight'], self.WEIGHT_DECIMALS)
+                    != round(last['weight'], self.WEIGHT_DECIMALS))
+                or now - self.last_emit_time >= self.HEARTBEAT_INTERVAL):
+            self.last_emitted = weight_data
+            self.last_emit_time = now
+            self.weight_updated.emit(weight_data)
+    
+    def _parse_weight_data(self, frame: bytes) -> Optional[Dict]:
+        """Parse one raw weight frame into structured format"""
+        # Simple parsing - in real implementation, use the protocol parser
+        frame = frame.strip()
+        
+        # Look for weight pattern
+        weight_match = WEIGHT_PATTERN.search(frame)
+        if not weight_match:
+            return None
+        
+        try:
+            weight = float(weight_match.group(1))
+        except ValueError as e:
+            logger.warning("Weight parsing error: %s", e)
+            return None
+        
+        up = frame.upper()
+        
+        # Determine stability (simple heuristic; 'ST' also covers 'STABLE')
+        stable = b'ST' in up
+        
+        # Determine unit
+        unit = 'LB' if b'LB' in up else ('G' if b' G' in up else 'KG')
+        
+        return {
+            'weight': weight,
+            'stable': stable,
+            'unit': unit,
+            'timestamp': datetime.now().isoformat(),
+            'raw_data': frame.decode('ascii', 'replace')
+        }
+
+class TransactionTableModel(QAbstractTableModel):
+    """Read-only transactions model for the Transactions tab
+    
+    Each column is kept as its own list, and display strings are only
+    formatted in data() for the rows the view actually paints.
+    """
+    
+    COLUMNS = (
+        # (header, transaction key, is weight)
+        ("Ticket #", 'ticket_no', False),
+        ("Vehicle", 'vehicle_no', False),
+        ("Driver", 'driver_name', False),
+        ("Gross (KG)", 'gross_weight', True),
+        ("Tare (KG)", 'tare_weight', True),
+        ("Net (KG)", 'net_weight', True),
+        ("Status", 'status', False),
+        ("Date/Time", 'opened_at_utc', False),
+    )
+    
+    def __init__(self, transactions: Optional[List[Dict]] = None, parent=None):
+        super().__init__(parent)
+        self.columns = [[] for _ in self.COLUMNS]
+        self.row_count = 0
+        if transactions:
+            self.set_transactions(transactions)
+    
+    def set_transactions(self, transactions: List[Dict]):
+        """Replace the model contents"""
+        self.beginResetModel()
+        self.columns = [
+            [transaction.get(key) for transaction in transactions]
+            for _, key, _ in self.COLUMNS
+        ]
+        self.row_count = len(transactions)
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self.row_count
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.COLUMNS)
+    
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        value = self.columns[index.column()][index.row()]
+        is_weight = self.COLUMNS[index.column()][2]
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            if value is None:
+                return ''
+            return f"{value:.2f}" if is_weight else str(value)
+        
+        if role == Qt.ItemDataRole.UserRole:
+            # Raw value for sorting
+            if value is None:
+                return 0.0 if is_weight else ''
+            return value
+        
+        if role == Qt.ItemDataRole.TextAlignmentRole and is_weight:
+            return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+        
+        return None
+    
+    def headerData(self, section: int, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.COLUMNS[section][0]
+        return super().headerData(section, orientation, role)
+
+class RowTableModel(QAbstractTableModel):
+    """Read-only model over rows of preformatted display strings"""
+    
+    def __init__(self, headers: List[str], parent=None):
+        super().__init__(parent)
+        self.headers = headers
+        self.rows = []
+    
+    def set_rows(self, rows: List[tuple]):
+        """Replace the model contents
+        
+        When the new rows are the old ones with entries added on top (the
+        usual newest-first refresh), only those rows are inserted and any
+        pushed past the end removed; otherwise the model is reset.
+        """
+        if rows == self.rows:
+            return
+        
+        added = self.prepended_count(rows)
+        if added is None:
+            self.beginResetModel()
+            self.rows = rows
+            self.endResetModel()
+            return
+        
+        self.beginInsertRows(QModelIndex(), 0, added - 1)
+        self.rows = rows[:added] + self.rows
+        self.endInsertRows()
+        
+        if len(self.rows) > len(rows):
+            self.beginRemoveRows(QModelIndex(), len(rows), len(self.rows) - 1)
+            self.rows = rows
+            self.endRemoveRows()
+    
+    def prepended_count(self, rows: List[tuple]) -> Optional[int]:
+        """Number of rows added on top of the current rows, if that is all that changed
+        
+        At least one current row must still be there, so unrelated data is
+        not mistaken for a full prepend.
+        """
+        for added in range(1, len(rows)):
+            kept = rows[added:]
+            if kept == self.rows[:len(kept)]:
+                return added
+        return None
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.rows)
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.headers)
+    
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if index.isValid() and role == Qt.ItemDataRole.DisplayRole:
+            return self.rows[index.row()][index.column()]
         return None
+    
+    def headerData(self, section: int, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.headers[section]
+        return super().headerData(section, orientation, role)
+
+class TaskSignals(QObject):
+    """Signals for BackgroundTask (QRunnable itself cannot emit)"""
+    
+    finished = pyqtSignal(object)  # Result of the callable
+    failed = pyqtSignal(str)  # Error message
+    progress = pyqtSignal(int)  # Items processed so far
+
+class BackgroundTask(QRunnable):
+    """Run a callable on the shared QThreadPool and report back by signal"""
+    
+    def __init__(self, fn, *args, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = TaskSignals()
+    
+    def run(self):
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(result)
+
+class DataPrewarmWorker(QThread):
+    """Background thread that warms the database while the login dialog closes"""
+    
+    PREWARM_QUERIES = (
+        "SELECT * FROM transactions ORDER BY opened_at_utc DESC LIMIT 10",
+    )
+    
+    def __init__(self, data_access: DataAccessLayer):
+        super().__init__()
+        self.data_access = data_access
+    
+    def run(self):
+        """Touch the tables the dashboard reads first so their pages are cached"""
+        try:
+            # Fills the master-data cache the weighing dropdowns read from
+            self.data_access.get_master_data_snapshot()
+            
+            with self.data_access.get_connection() as conn:
+                for query in self.PREWARM_QUERIES:
+                    conn.execute(query).fetchall()
+        except Exception as e:
+            print(f"Database prewarm error: {e}")
 
 class MainWindow(QMainWindow):
     """Main application window for SCALE System"""
     
+    weight_monitor_start = pyqtSignal(object)  # RS232Config
+    weight_monitor_stop = pyqtSignal()
+    
+    WEIGHT_UI_INTERVAL = 0.1  # Minimum seconds between stability/unit repaints
+    
     def __init__(self):
         super().__init__()
         
         # Core services
         self.auth_service = AuthenticationService()
         self.workflow_controller = WorkflowController()
-        self.data_access = DataAccessLayer(str(DATABASE_PATH))
+        self.data_access = get_data_access(str(DATABASE_PATH))
+        
+        # Shared pool for blocking DB and hardware work
+        self.thread_pool = QThreadPool.globalInstance()
+        self.backup_progress = None  # QProgressDialog while a backup/restore runs
+        self.shortcuts_dialog = None  # Built on first F1 press, then reused
         
         # Hardware management
         self.rs232_config = None
-        self.weight_monitor = None
+        self.prewarm_worker = None
+        
+        # One monitoring thread reused across connect/disconnect cycles
+        self.weight_thread = QThread(self)
+        self.weight_worker = WeightWorker()
+        self.weight_worker.moveToThread(self.weight_thread)
+        self.weight_worker.weight_updated.connect(self.on_weight_updated)
+        self.weight_worker.connection_status.connect(self.on_hardware_connection_status)
+        self.weight_monitor_start.connect(self.weight_worker.start_loop)
+        self.weight_monitor_stop.connect(self.weight_worker.stop_loop)
+        self.weight_thread.start()
+        
+        # Single display-rate tick (~30 Hz) that applies all weight UI changes
+        self.weight_refresh_timer = QTimer(self)
+        self.weight_refresh_timer.setInterval(33)
+        self.weight_refresh_timer.timeout.connect(self.weight_ui_tick)
         
         # Current state
         self.current_user = None
@@ -156,6 +607,45 @@ class MainWindow(QMainWindow):
         self.current_weight = None
         self.is_connected = False
         
+        # Coalesced stability/unit updates (see on_weight_updated)
+        self.pending_weight_state = None
+        self.last_weight_state_update = 0.0
+        
+        # Last values shown in the weight display labels
+        self.shown_weight_text = None
+        self.shown_update_time = None
+        # Date/clock strings for the current second (see refresh_timestamp_cache)
+        self.ts_cached_sec = None
+        self.ts_cached_date = ""
+        self.ts_cached_clock = ""
+        self.shown_stable = None
+        self.shown_unit = None
+        
+        # Serial console state (kept even before the console tab is built)
+        # Lines are buffered and flushed to the widget in batches
+        self.console_buffer = deque(maxlen=1000)
+        self.console_tick_timer = QTimer(self)
+        self.console_tick_timer.setInterval(100)
+        self.console_tick_timer.timeout.connect(self.console_tick)
+        self.console_paused = False
+        # Console widgets that other handlers touch; set by create_console_tab
+        self.console_output = None
+        self.console_status_label = None
+        # RX lines and statistics only reach the console while its tab is shown
+        self.console_visible = False
+        self.packet_recording = False
+        self.recording_fd = None
+        # Recorded packets are written to disk in batches, not per packet
+        self.record_buffer = bytearray()
+        self.record_flush_timer = QTimer(self)
+        self.record_flush_timer.setInterval(250)
+        self.record_flush_timer.timeout.connect(self.flush_recording)
+        self.packets_received = 0
+        self.bytes_received = 0
+        self.errors_count = 0
+        # Statistics labels are refreshed by console_tick rather than per packet
+        self.stats_shown = None
+        
         # UI setup
         self.setup_ui()
         self.setup_status_bar()
@@ -173,91 +663,7 @@ class MainWindow(QMainWindow):
         self.setGeometry(100, 100, 1200, 800)
         
         # Apply professional styling
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f5f5f5;
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #cccccc;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 15px;
-                background-color: white;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 20px;
-                padding: 0 10px 0 10px;
-                background-color: #f5f5f5;
-            }
-            QPushButton {
-                background-color: #0078d4;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-                min-width: 80px;
-            }
-            QPushButton:hover {
-                background-color: #106ebe;
-            }
-            QPushButton:pressed {
-                background-color: #005a9e;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-                color: #666666;
-            }
-            QPushButton.success {
-                background-color: #107c10;
-            }
-            QPushButton.success:hover {
-                background-color: #0e6b0e;
-            }
-            QPushButton.warning {
-                background-color: #ff8c00;
-            }
-            QPushButton.warning:hover {
-                background-color: #e67a00;
-            }
-            QPushButton.danger {
-                background-color: #d83b01;
-            }
-            QPushButton.danger:hover {
-                background-color: #c33400;
-            }
-            QLineEdit, QComboBox {
-                padding: 6px;
-                border: 1px solid #cccccc;
-                border-radius: 4px;
-                background-color: white;
-            }
-            QTableWidget {
-                gridline-color: #e1e1e1;
-                selection-background-color: #0078d4;
-            }
-            QTableWidget::item {
-                padding: 8px;
-            }
-            QTabWidget::pane {
-                border: 1px solid #cccccc;
-                background-color: white;
-            }
-            QTabBar::tab {
-                background-color: #e1e1e1;
-                padding: 8px 16px;
-                margin-right: 2px;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-            }
-            QTabBar::tab:selected {
-                background-color: #0078d4;
-                color: white;
-            }
-        """)
+        self.setStyleSheet(MAIN_WINDOW_QSS)
         
         # Central widget with tabs
         self.central_widget = QWidget()
@@ -280,26 +686,55 @@ class MainWindow(QMainWindow):
         self.weighing_tab = self.create_weighing_tab()
         self.tab_widget.addTab(self.weighing_tab, "⚖️ Weighing")
         
+        # The remaining tabs are built the first time they are shown
+        self.lazy_tab_builders = {}
+        
         # Transactions tab
-        self.transactions_tab = self.create_transactions_tab()
-        self.tab_widget.addTab(self.transactions_tab, "📄 Transactions")
+        self.transactions_tab = self.add_lazy_tab(self.create_transactions_tab, "📄 Transactions")
         
         # Reports tab
-        self.reports_tab = self.create_reports_tab()
-        self.tab_widget.addTab(self.reports_tab, "📅 Reports")
+        self.reports_tab = self.add_lazy_tab(self.create_reports_tab, "📅 Reports")
         
         # Settings tab
-        self.settings_tab = self.create_settings_tab()
-        self.tab_widget.addTab(self.settings_tab, "⚙️ Settings")
+        self.settings_tab = self.add_lazy_tab(self.create_settings_tab, "⚙️ Settings")
         
         # Serial Console tab (for debugging)
-        self.console_tab = self.create_console_tab()
-        self.tab_widget.addTab(self.console_tab, "🔌 Serial Console")
+        self.console_tab = self.add_lazy_tab(self.create_console_tab, "🔌 Serial Console")
+        
+        self.tab_widget.currentChanged.connect(self.build_lazy_tab)
+        self.tab_widget.currentChanged.connect(self.on_tab_changed)
         
         main_layout.addWidget(self.tab_widget)
         
         self.central_widget.setLayout(main_layout)
     
+    def add_lazy_tab(self, builder, title: str) -> QWidget:
+        """Add a placeholder tab whose contents builder() creates on first view"""
+        placeholder = QWidget()
+        placeholder_layout = QVBoxLayout(placeholder)
+        placeholder_layout.setContentsMargins(0, 0, 0, 0)
+        
+        index = self.tab_widget.addTab(placeholder, title)
+        self.lazy_tab_builders[index] = builder
+        return placeholder
+    
+    @pyqtSlot(int)
+    def build_lazy_tab(self, index: int):
+        """Build a deferred tab the first time it becomes current"""
+        builder = self.lazy_tab_builders.pop(index, None)
+        if builder:
+            self.tab_widget.widget(index).layout().addWidget(builder())
+    
+    @pyqtSlot(int)
+    def on_tab_changed(self, index: int):
+        """Pause console updates while the console tab is hidden"""
+        self.console_visible = self.tab_widget.widget(index) is self.console_tab
+        if self.console_visible:
+            self.console_tick()
+            self.console_tick_timer.start()
+        else:
+            self.console_tick_timer.stop()
+    
     def create_header_section(self) -> QWidget:
         """Create the header section with system status"""
         
@@ -343,9 +778,10 @@ class MainWindow(QMainWindow):
         header.setLayout(layout)
         
         # Update time every second
-        self.time_timer = QTimer()
-        self.time_timer.timeout.connect(self.update_time_display)
-        self.time_timer.start(1000)
+        # Single-shot, re-armed on each tick; only runs while the window is shown
+        self.time_timer = QTimer(self)
+        self.time_timer.setSingleShot(True)
+        self.time_timer.timeout.connect(self.tick_time_display)
         self.update_time_display()
         
         return header
@@ -412,16 +848,7 @@ class MainWindow(QMainWindow):
         weight_font.setBold(True)
         self.weight_display.setFont(weight_font)
         self.weight_display.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.weight_display.setStyleSheet("""
-            QLabel {
-                background-color: #1e1e1e;
-                color: #00ff00;
-                border: 2px solid #333333;
-                border-radius: 8px;
-                padding: 20px;
-                margin: 10px;
-            }
-        """)
+        self.weight_display.setObjectName("weightDisplay")
         layout.addWidget(self.weight_display)
         
         # Weight status indicators
@@ -439,7 +866,7 @@ class MainWindow(QMainWindow):
         
         # Connection info
         self.connection_info_label = QLabel("⚠️ No hardware connected")
-        self.connection_info_label.setStyleSheet("color: #ff6600; font-weight: bold;")
+        self.connection_info_label.setObjectName("connectionInfo")
         layout.addWidget(self.connection_info_label)
         
         group.setLayout(layout)
@@ -452,11 +879,11 @@ class MainWindow(QMainWindow):
         layout = QVBoxLayout()
         
         # Transactions table
-        self.recent_transactions_table = QTableWidget()
-        self.recent_transactions_table.setColumnCount(5)
-        self.recent_transactions_table.setHorizontalHeaderLabels([
-            "Ticket #", "Vehicle", "Net Weight", "Status", "Date"
-        ])
+        self.recent_transactions_model = RowTableModel(
+            ["Ticket #", "Vehicle", "Net Weight", "Status", "Date"], self
+        )
+        self.recent_transactions_table = QTableView()
+        self.recent_transactions_table.setModel(self.recent_transactions_model)
         
         header = self.recent_transactions_table.horizontalHeader()
         header.setStretchLastSection(True)
@@ -576,9 +1003,10 @@ class MainWindow(QMainWindow):
         status_group = QGroupBox("Current Transaction Status")
         status_layout = QVBoxLayout()
         
-        self.transaction_status_text = QTextEdit()
+        self.transaction_status_text = QPlainTextEdit()
         self.transaction_status_text.setMaximumHeight(150)
         self.transaction_status_text.setReadOnly(True)
+        self.transaction_status_text.setMaximumBlockCount(500)
         self.transaction_status_text.setPlainText("No active transaction. Click 'Start Weighing' to begin.")
         
         status_layout.addWidget(self.transaction_status_text)
@@ -626,12 +1054,14 @@ class MainWindow(QMainWindow):
         layout.addWidget(filter_group)
         
         # Transactions table
-        self.transactions_table = QTableWidget()
-        self.transactions_table.setColumnCount(8)
-        self.transactions_table.setHorizontalHeaderLabels([
-            "Ticket #", "Vehicle", "Driver", "Gross (KG)", "Tare (KG)", 
-            "Net (KG)", "Status", "Date/Time"
-        ])
+        self.transactions_model = TransactionTableModel(parent=self)
+        self.transactions_proxy = QSortFilterProxyModel(self)
+        self.transactions_proxy.setSourceModel(self.transactions_model)
+        self.transactions_proxy.setSortRole(Qt.ItemDataRole.UserRole)
+        
+        self.transactions_table = QTableView()
+        self.transactions_table.setModel(self.transactions_proxy)
+        self.transactions_table.setSortingEnabled(True)
         
         header = self.transactions_table.horizontalHeader()
         header.setStretchLastSection(True)
@@ -774,9 +1204,9 @@ class MainWindow(QMainWindow):
         user_group = QGroupBox("User Management")
         user_mgmt_layout = QVBoxLayout()
         
-        self.users_table = QTableWidget()
-        self.users_table.setColumnCount(4)
-        self.users_table.setHorizontalHeaderLabels(["Username", "Role", "Status", "Last Login"])
+        self.users_model = RowTableModel(["Username", "Role", "Status", "Last Login"], self)
+        self.users_table = QTableView()
+        self.users_table.setModel(self.users_model)
         
         user_mgmt_layout.addWidget(self.users_table)
         
@@ -831,7 +1261,7 @@ class MainWindow(QMainWindow):
             "Restore from backup to recover previous system state."
         )
         backup_info_label.setWordWrap(True)
-        backup_info_label.setStyleSheet("color: #666; font-style: italic;")
+        backup_info_label.setObjectName("infoNote")
         backup_layout.addWidget(backup_info_label, 0, 0, 1, 2)
         
         create_backup_btn = QPushButton("💾 Create Backup")
@@ -855,6 +1285,10 @@ class MainWindow(QMainWindow):
         layout.addWidget(settings_tabs)
         
         tab.setLayout(layout)
+        
+        if self.current_user:
+            self.load_users_data()
+        
         return tab
     
     def create_console_tab(self) -> QWidget:
@@ -868,8 +1302,13 @@ class MainWindow(QMainWindow):
         controls_layout = QGridLayout()
         
         # Connection status
-        self.console_status_label = QLabel("Status: Disconnected")
-        self.console_status_label.setStyleSheet("color: red; font-weight: bold;")
+        # (the tab is built lazily, so start from the current state)
+        if self.is_connected:
+            self.console_status_label = QLabel("Status: Connected")
+        else:
+            self.console_status_label = QLabel("Status: Disconnected")
+        self.console_status_label.setObjectName("consoleStatus")
+        self.console_status_label.setProperty("connected", self.is_connected)
         controls_layout.addWidget(QLabel("Connection Status:"), 0, 0)
         controls_layout.addWidget(self.console_status_label, 0, 1)
         
@@ -879,7 +1318,7 @@ class MainWindow(QMainWindow):
         controls_layout.addWidget(self.recording_enabled, 1, 0)
         
         self.recording_file_label = QLabel("Not recording")
-        self.recording_file_label.setStyleSheet("font-style: italic; color: #666;")
+        self.recording_file_label.setObjectName("recordingFile")
         controls_layout.addWidget(self.recording_file_label, 1, 1)
         
         # Statistics
@@ -907,22 +1346,12 @@ class MainWindow(QMainWindow):
         raw_data_group = QGroupBox("Raw Serial Data Stream")
         raw_data_layout = QVBoxLayout()
         
-        self.console_output = QTextEdit()
+        self.console_output = QPlainTextEdit()
         self.console_output.setReadOnly(True)
         self.console_output.setFont(QFont("Consolas", 9))
-        self.console_output.setStyleSheet("""
-            QTextEdit {
-                background-color: #1e1e1e;
-                color: #00ff00;
-                border: 1px solid #333;
-            }
-        """)
-        # Limit console output (PyQt6 compatibility)
-        try:
-            self.console_output.setMaximumBlockCount(1000)
-        except AttributeError:
-            # setMaximumBlockCount not available in this PyQt version
-            pass
+        self.console_output.setObjectName("serialConsole")
+        # Old lines are dropped once the console holds 1000 of them
+        self.console_output.setMaximumBlockCount(1000)
         
         raw_data_layout.addWidget(self.console_output)
         
@@ -972,22 +1401,10 @@ class MainWindow(QMainWindow):
         predefined_layout = QHBoxLayout()
         predefined_layout.addWidget(QLabel("Quick Commands:"))
         
-        status_cmd_btn = QPushButton("STATUS")
-        status_cmd_btn.clicked.connect(lambda: self.send_predefined_command("STATUS"))
-        
-        zero_cmd_btn = QPushButton("ZERO")
-        zero_cmd_btn.clicked.connect(lambda: self.send_predefined_command("ZERO"))
-        
-        tare_cmd_btn = QPushButton("TARE")
-        tare_cmd_btn.clicked.connect(lambda: self.send_predefined_command("TARE"))
-        
-        test_cmd_btn = QPushButton("TEST")
-        test_cmd_btn.clicked.connect(lambda: self.send_predefined_command("TEST"))
-        
-        predefined_layout.addWidget(status_cmd_btn)
-        predefined_layout.addWidget(zero_cmd_btn)
-        predefined_layout.addWidget(tare_cmd_btn)
-        predefined_layout.addWidget(test_cmd_btn)
+        for command in self.QUICK_COMMANDS:
+            command_btn = QPushButton(command)
+            command_btn.clicked.connect(partial(self.send_predefined_command, command))
+            predefined_layout.addWidget(command_btn)
         predefined_layout.addStretch()
         
         command_layout.addLayout(predefined_layout)
@@ -1009,139 +1426,73 @@ class MainWindow(QMainWindow):
         
         layout.addWidget(console_splitter)
         
-        # Initialize console state
-        self.console_paused = False
-        self.packet_recording = False
-        self.recording_file = None
-        self.packets_received = 0
-        self.bytes_received = 0
-        self.errors_count = 0
-        
         tab.setLayout(layout)
         return tab
-        """Setup the status bar"""
-        
-        self.status_bar = QStatusBar()
-        self.setStatusBar(self.status_bar)
-        
-        # Status indicators
-        self.status_bar.addWidget(QLabel("Status:"))
-        
-        self.main_status_label = QLabel("Ready")
-        self.status_bar.addWidget(self.main_status_label)
-        
-        self.status_bar.addPermanentWidget(QLabel(" | "))
-        
-        self.connection_status_label = QLabel("Hardware: Disconnected")
-        self.status_bar.addPermanentWidget(self.connection_status_label)
+    
+    # Menus as (menu title, entries); entries are (label, shortcut, slot name)
+    # and None marks a separator
+    MENU_SPEC = [
+        ("File", [
+            ("New Transaction", "Ctrl+N", "start_new_transaction"),
+            None,
+            ("Exit", "Ctrl+Q", "close"),
+        ]),
+        ("Weighing", [
+            ("Timbang I (First Weigh)", "F2", "perform_timbang_1"),
+            ("Timbang II (Second Weigh)", "F3", "perform_timbang_2"),
+            None,
+            ("New Transaction", "F4", "start_new_transaction"),
+            ("Save Transaction", "Ctrl+S", "save_current_transaction"),
+        ]),
+        ("Tools", [
+            ("Hardware Configuration", None, "configure_hardware"),
+            ("Refresh/Reconnect Hardware", "F5", "refresh_hardware_connection"),
+            None,
+            ("Create Backup", None, "create_backup"),
+            ("Export Transactions", "Ctrl+E", "export_transactions"),
+            None,
+            ("Master Data Management", "Ctrl+M", "open_master_data_dialog"),
+        ]),
+        ("Help", [
+            ("Keyboard Shortcuts", "F1", "show_shortcuts_dialog"),
+            ("About", None, "show_about_dialog"),
+        ]),
+    ]
+    
+    # Toolbar entries, same format as MENU_SPEC
+    TOOLBAR_SPEC = [
+        ("🔌 Connect", None, "configure_hardware"),
+        ("🆕 New Transaction", None, "start_new_transaction"),
+        None,
+        ("🔄 Refresh", None, "refresh_all_data"),
+    ]
+    
+    def add_actions(self, container, entries):
+        """Add QActions described by a MENU_SPEC/TOOLBAR_SPEC entry list"""
+        for entry in entries:
+            if entry is None:
+                container.addSeparator()
+                continue
+            label, shortcut, slot = entry
+            action = QAction(label, self)
+            if shortcut:
+                action.setShortcut(shortcut)
+            action.triggered.connect(getattr(self, slot))
+            container.addAction(action)
     
     def setup_menu_bar(self):
         """Setup the menu bar"""
         
         menubar = self.menuBar()
-        
-        # File menu
-        file_menu = menubar.addMenu("File")
-        
-        new_action = QAction("New Transaction", self)
-        new_action.setShortcut("Ctrl+N")
-        new_action.triggered.connect(self.start_new_transaction)
-        file_menu.addAction(new_action)
-        
-        file_menu.addSeparator()
-        
-        exit_action = QAction("Exit", self)
-        exit_action.setShortcut("Ctrl+Q")
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
-        
-        # Weighing menu
-        weighing_menu = menubar.addMenu("Weighing")
-        
-        timbang1_action = QAction("Timbang I (First Weigh)", self)
-        timbang1_action.setShortcut("F2")
-        timbang1_action.triggered.connect(self.perform_timbang_1)
-        weighing_menu.addAction(timbang1_action)
-        
-        timbang2_action = QAction("Timbang II (Second Weigh)", self)
-        timbang2_action.setShortcut("F3")
-        timbang2_action.triggered.connect(self.perform_timbang_2)
-        weighing_menu.addAction(timbang2_action)
-        
-        weighing_menu.addSeparator()
-        
-        new_transaction_action = QAction("New Transaction", self)
-        new_transaction_action.setShortcut("F4")
-        new_transaction_action.triggered.connect(self.start_new_transaction)
-        weighing_menu.addAction(new_transaction_action)
-        
-        save_transaction_action = QAction("Save Transaction", self)
-        save_transaction_action.setShortcut("Ctrl+S")
-        save_transaction_action.triggered.connect(self.save_current_transaction)
-        weighing_menu.addAction(save_transaction_action)
-        
-        # Tools menu
-        tools_menu = menubar.addMenu("Tools")
-        
-        hardware_config_action = QAction("Hardware Configuration", self)
-        hardware_config_action.triggered.connect(self.configure_hardware)
-        tools_menu.addAction(hardware_config_action)
-        
-        refresh_action = QAction("Refresh/Reconnect Hardware", self)
-        refresh_action.setShortcut("F5")
-        refresh_action.triggered.connect(self.refresh_hardware_connection)
-        tools_menu.addAction(refresh_action)
-        
-        tools_menu.addSeparator()
-        
-        backup_action = QAction("Create Backup", self)
-        backup_action.triggered.connect(self.create_backup)
-        tools_menu.addAction(backup_action)
-        
-        export_action = QAction("Export Transactions", self)
-        export_action.setShortcut("Ctrl+E")
-        export_action.triggered.connect(self.export_transactions)
-        tools_menu.addAction(export_action)
-        
-        tools_menu.addSeparator()
-        
-        master_data_action = QAction("Master Data Management", self)
-        master_data_action.setShortcut("Ctrl+M")
-        master_data_action.triggered.connect(self.open_master_data_dialog)
-        tools_menu.addAction(master_data_action)
-        
-        # Help menu
-        help_menu = menubar.addMenu("Help")
-        
-        shortcuts_action = QAction("Keyboard Shortcuts", self)
-        shortcuts_action.setShortcut("F1")
-        shortcuts_action.triggered.connect(self.show_shortcuts_dialog)
-        help_menu.addAction(shortcuts_action)
-        
-        about_action = QAction("About", self)
-        about_action.triggered.connect(self.show_about_dialog)
-        help_menu.addAction(about_action)
+        for menu_title, entries in self.MENU_SPEC:
+            self.add_actions(menubar.addMenu(menu_title), entries)
     
     def setup_toolbar(self):
         """Setup the toolbar"""
         
         toolbar = QToolBar()
         self.addToolBar(toolbar)
-        
-        # Quick action buttons
-        connect_action = QAction("🔌 Connect", self)
-        connect_action.triggered.connect(self.configure_hardware)
-        toolbar.addAction(connect_action)
-        
-        new_trans_action = QAction("🆕 New Transaction", self)
-        new_trans_action.triggered.connect(self.start_new_transaction)
-        toolbar.addAction(new_trans_action)
-        
-        toolbar.addSeparator()
-        
-        refresh_action = QAction("🔄 Refresh", self)
-        refresh_action.triggered.connect(self.refresh_all_data)
-        toolbar.addAction(refresh_action)
+        self.add_actions(toolbar, self.TOOLBAR_SPEC)
     
     def setup_status_bar(self):
         """Setup the status bar"""
@@ -1155,11 +1506,27 @@ class MainWindow(QMainWindow):
         self.main_status_label = QLabel("Ready")
         self.status_bar.addWidget(self.main_status_label)
         
+        # Busy indicator for background exports
+        self.export_progress = QProgressBar()
+        self.export_progress.setMaximumWidth(150)
+        self.export_progress.hide()
+        self.status_bar.addWidget(self.export_progress)
+        
         self.status_bar.addPermanentWidget(QLabel(" | "))
         
         self.connection_status_label = QLabel("Hardware: Disconnected")
         self.status_bar.addPermanentWidget(self.connection_status_label)
     
+    NOTIFICATION_TIMEOUT = 5000  # ms a status bar notification stays visible
+    
+    def notify(self, message: str):
+        """Announce a completed action in the status bar
+        
+        Unlike QMessageBox.information this does not run a nested event
+        loop, so weight updates keep flowing while the message is shown.
+        """
+        self.status_bar.showMessage(message, self.NOTIFICATION_TIMEOUT)
+    
     def setup_connections(self):
         """Setup signal connections"""
         
@@ -1173,6 +1540,7 @@ class MainWindow(QMainWindow):
         """Show the login dialog"""
         
         login_dialog = LoginDialog(self.auth_service, self)
+        login_dialog.login_succeeded.connect(self.on_login_succeeded)
         result = login_dialog.exec()
         
         if result == QDialog.DialogCode.Accepted:
@@ -1187,6 +1555,20 @@ class MainWindow(QMainWindow):
             # If login cancelled, exit application
             self.close()
     
+    @pyqtSlot(dict)
+    def on_login_succeeded(self, user: Dict):
+        """Show a transient welcome message once the login dialog accepts"""
+        self.status_bar.showMessage(f"Welcome, {user['username']}!", 3000)
+        self.prewarm(user)
+    
+    def prewarm(self, user: Dict):
+        """Start warming the dashboard data in the background"""
+        if self.prewarm_worker and self.prewarm_worker.isRunning():
+            return
+        
+        self.prewarm_worker = DataPrewarmWorker(self.data_access)
+        self.prewarm_worker.start()
+    
     def enable_user_interface(self):
         """Enable interface elements based on user permissions"""
         
@@ -1196,7 +1578,7 @@ class MainWindow(QMainWindow):
         # Enable basic functionality
         self.connect_hardware_btn.setEnabled(True)
         
-        # Populate dropdown data from database
+        # Populate dropdown data from database (loaded in the background)
         self.refresh_dropdown_data()
         
         # Enable transaction creation if user has permission
@@ -1226,16 +1608,11 @@ class MainWindow(QMainWindow):
         if not self.rs232_config:
             return
         
-        # Stop existing connection
-        if self.weight_monitor:
-            self.weight_monitor.stop_monitoring()
-        
-        # Start new weight monitoring
-        self.weight_monitor = WeightDisplayWorker()
-        self.weight_monitor.weight_updated.connect(self.on_weight_updated)
-        self.weight_monitor.connection_status.connect(self.on_hardware_connection_status)
-        
-        self.weight_monitor.start_monitoring(self.rs232_config)
+        # Restart weight monitoring on the worker thread
+        # (start_loop drops any existing connection first)
+        self.weight_worker.interrupt_read()
+        self.weight_monitor_start.emit(self.rs232_config)
+        self.weight_refresh_timer.start()
         
         # Update UI
         self.hardware_status_label.setText(
@@ -1244,112 +1621,161 @@ class MainWindow(QMainWindow):
     
     @pyqtSlot(dict)
     def on_weight_updated(self, weight_data: Dict):
-        """Handle weight update from hardware"""
+        """Handle a stability, unit or significant weight change from hardware
+        
+        Only records the change; weight_ui_tick applies it to the widgets at
+        most every WEIGHT_UI_INTERVAL seconds.
+        """
         
         self.current_weight = weight_data
+        self.pending_weight_state = weight_data
+    
+    @pyqtSlot()
+    def weight_ui_tick(self):
+        """Apply pending weight UI changes; runs from weight_refresh_timer"""
+        self.refresh_weight_display()
+        if (self.pending_weight_state is not None
+                and time.monotonic() - self.last_weight_state_update >= self.WEIGHT_UI_INTERVAL):
+            self.flush_weight_state()
+    
+    def flush_weight_state(self):
+        """Apply the newest pending stability/unit state to the widgets"""
+        
+        weight_data = self.pending_weight_state
+        self.last_weight_state_update = time.monotonic()
+        if weight_data is None:
+            return
+        self.pending_weight_state = None
         
-        # Update weight display
-        weight = weight_data.get('weight', 0)
         unit = weight_data.get('unit', 'KG')
         stable = weight_data.get('stable', False)
         
-        self.weight_display.setText(f"{weight:.2f} {unit}")
+        # Enable/disable capture button based on stability
+        self.capture_weight_btn.setEnabled(stable and self.current_transaction is not None)
+        
+        if unit != self.shown_unit:
+            self.shown_unit = unit
+            self.unit_label.setText(f"📊 Unit: {unit}")
+        
+        # Re-polishing the label is costly, so only do it when stability flips
+        if stable == self.shown_stable:
+            return
+        self.shown_stable = stable
         
         # Update stability indicator
         if stable:
             self.stability_label.setText("🟢 Stability: STABLE")
-            self.weight_display.setStyleSheet("""
-                QLabel {
-                    background-color: #1e1e1e;
-                    color: #00ff00;
-                    border: 2px solid #00ff00;
-                    border-radius: 8px;
-                    padding: 20px;
-                    margin: 10px;
-                }
-            """)
         else:
             self.stability_label.setText("🟡 Stability: MOTION")
-            self.weight_display.setStyleSheet("""
-                QLabel {
-                    background-color: #1e1e1e;
-                    color: #ffff00;
-                    border: 2px solid #ffaa00;
-                    border-radius: 8px;
-                    padding: 20px;
-                    margin: 10px;
-                }
-            """)
-        
-        self.unit_label.setText(f"📊 Unit: {unit}")
-        self.last_update_label.setText(
-            f"🕐 Last Update: {datetime.now().strftime('%H:%M:%S')}"
-        )
+        set_style_state(self.weight_display, "stable", stable)
+    
+    def refresh_weight_display(self):
+        """Account for every frame since the last tick and show the newest one
         
-        # Enable/disable capture button based on stability
-        if hasattr(self, 'capture_weight_btn'):
-            self.capture_weight_btn.setEnabled(stable and self.current_transaction is not None)
+        Statistics, the console and recording see each frame; the labels
+        only show the last one.
+        """
+        
+        frames = self.weight_worker.take_frames()
+        if not frames:
+            return
+        
+        for frame in frames:
+            self.log_received_frame(frame)
+        
+        weight_data = frames[-1]
+        self.current_weight = weight_data
+        
+        # Update weight display, skipping labels whose text would not change
+        weight = weight_data.get('weight', 0)
+        unit = weight_data.get('unit', 'KG')
+        weight_text = format_weight(weight, unit=unit)
+        if weight_text != self.shown_weight_text:
+            self.shown_weight_text = weight_text
+            self.weight_display.setText(weight_text)
+        
+        self.refresh_timestamp_cache()
+        if self.ts_cached_clock != self.shown_update_time:
+            self.shown_update_time = self.ts_cached_clock
+            self.last_update_label.setText(f"🕐 Last Update: {self.ts_cached_clock}")
+    
+    def log_received_frame(self, weight_data: Dict):
+        """Count, log and record one received frame"""
         
-        # Log to serial console if available
         raw_data = weight_data.get('raw_data', '')
-        if hasattr(self, 'console_output') and raw_data:
-            self.log_to_console(f"[RX] {raw_data}")
-            
-            # Update statistics
+        if raw_data:
+            # Statistics are counted even while the console is hidden
             self.packets_received += 1
             self.bytes_received += len(raw_data)
-            self.update_console_statistics()
+            if self.console_visible:
+                self.log_to_console(f"[RX] {raw_data}")
             
             # Record to file if recording enabled
-            if self.packet_recording and self.recording_file:
-                try:
-                    self.recording_file.write(f"[{datetime.now().isoformat()}] [RX] {raw_data}\n")
-                    self.recording_file.flush()
-                except Exception as e:
-                    self.errors_count += 1
-                    self.log_to_console(f"[ERROR] Recording error: {str(e)}")
+            if self.packet_recording and self.recording_fd is not None:
+                self.record_packet("RX", raw_data)
+    
+    def stop_weight_monitoring(self):
+        """Ask the worker thread to release the serial port"""
+        self.weight_refresh_timer.stop()
+        self.weight_worker.interrupt_read()
+        self.weight_monitor_stop.emit()
     
     @pyqtSlot(str, bool)
     def on_hardware_connection_status(self, message: str, connected: bool):
         """Handle hardware connection status updates"""
         
+        # Indicator styles are only re-polished when the connection state flips
+        state_changed = connected != self.is_connected
         self.is_connected = connected
         
-        if connected:
-            self.hardware_status_label.setText("🟢 Hardware: Connected")
-            self.connection_status_label.setText("Hardware: Connected")
-            self.connection_info_label.setText(f"✅ {message}")
-            self.connection_info_label.setStyleSheet("color: #10b010; font-weight: bold;")
-            
-            # Enable transaction controls
-            self.new_transaction_btn.setEnabled(True)
-            if self.current_user:
-                self.start_weighing_btn.setEnabled(True)
-            
-            # Update console status if available
-            if hasattr(self, 'console_status_label'):
-                self.console_status_label.setText("Status: Connected")
-                self.console_status_label.setStyleSheet("color: green; font-weight: bold;")
-                self.log_to_console(f"[SYSTEM] Hardware connected: {message}")
-            
-        else:
-            self.hardware_status_label.setText("🔴 Hardware: Disconnected")
-            self.connection_status_label.setText("Hardware: Disconnected")
-            self.connection_info_label.setText(f"❌ {message}")
-            self.connection_info_label.setStyleSheet("color: #ff6600; font-weight: bold;")
-            
-            # Disable transaction controls
-            self.new_transaction_btn.setEnabled(False)
-            self.start_weighing_btn.setEnabled(False)
-            
-            # Update console status if available
-            if hasattr(self, 'console_status_label'):
-                self.console_status_label.setText("Status: Disconnected")
-                self.console_status_label.setStyleSheet("color: red; font-weight: bold;")
-                self.log_to_console(f"[SYSTEM] Hardware disconnected: {message}")
-            self.capture_weight_btn.setEnabled(False)
-        
-        self.main_status_label.setText(message)
+        # Buttons don't need to signal these enable changes, and the labels
+        # below are repainted once when updates are re-enabled
+        self.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(self.new_transaction_btn), \
+                    QSignalBlocker(self.start_weighing_btn), \
+                    QSignalBlocker(self.capture_weight_btn):
+                if connected:
+                    self.hardware_status_label.setText("🟢 Hardware: Connected")
+                    self.connection_status_label.setText("Hardware: Connected")
+                    self.connection_info_label.setText(f"✅ {message}")
+                    if state_changed:
+                        set_style_state(self.connection_info_label, "connected", True)
+                
+                    # Enable transaction controls
+                    self.new_transaction_btn.setEnabled(True)
+                    if self.current_user:
+                        self.start_weighing_btn.setEnabled(True)
+                
+                    # Update console status if available
+                    if self.console_status_label is not None:
+                        self.console_status_label.setText("Status: Connected")
+                        if state_changed:
+                            set_style_state(self.console_status_label, "connected", True)
+                        self.log_to_console(f"[SYSTEM] Hardware connected: {message}")
+                
+                else:
+                    self.hardware_status_label.setText("🔴 Hardware: Disconnected")
+                    self.connection_status_label.setText("Hardware: Disconnected")
+                    self.connection_info_label.setText(f"❌ {message}")
+                    if state_changed:
+                        set_style_state(self.connection_info_label, "connected", False)
+                
+                    # Disable transaction controls
+                    self.new_transaction_btn.setEnabled(False)
+                    self.start_weighing_btn.setEnabled(False)
+                
+                    # Update console status if available
+                    if self.console_status_label is not None:
+                        self.console_status_label.setText("Status: Disconnected")
+                        if state_changed:
+                            set_style_state(self.console_status_label, "connected", False)
+                        self.log_to_console(f"[SYSTEM] Hardware disconnected: {message}")
+                    self.capture_weight_btn.setEnabled(False)
+            
+            self.main_status_label.setText(message)
+        finally:
+            self.setUpdatesEnabled(True)
     
     @pyqtSlot()
     def update_time_display(self):
@@ -1357,6 +1783,38 @@ class MainWindow(QMainWindow):
         current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         self.time_label.setText(f"🕐 {current_time}")
     
+    @pyqtSlot()
+    def tick_time_display(self):
+        """Update the clock and re-arm the timer for the next wall-clock second"""
+        self.update_time_display()
+        self.schedule_time_display()
+    
+    def schedule_time_display(self):
+        """Arm the clock timer for the next second boundary while visible"""
+        if self.isVisible() and not self.isMinimized():
+            self.time_timer.start(1000 - QTime.currentTime().msec())
+        else:
+            self.time_timer.stop()
+    
+    def showEvent(self, event):
+        """Resume the clock when the window is shown"""
+        super().showEvent(event)
+        self.update_time_display()
+        self.schedule_time_display()
+    
+    def hideEvent(self, event):
+        """Pause the clock while the window is hidden"""
+        super().hideEvent(event)
+        self.time_timer.stop()
+    
+    def changeEvent(self, event):
+        """Pause the clock while minimized and resume on restore"""
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange:
+            if not self.isMinimized():
+                self.update_time_display()
+            self.schedule_time_display()
+    
     # Transaction management methods
     @pyqtSlot()
     def start_new_transaction(self):
@@ -1454,11 +1912,9 @@ class MainWindow(QMainWindow):
             )
             
             if result['success']:
-                QMessageBox.information(
-                    self, "Transaction Complete",
-                    f"Transaction completed successfully!\n"
-                    f"Ticket #: {result['ticket_no']}\n"
-                    f"Net Weight: {result['net_weight']:.2f} KG"
+                self.notify(
+                    f"Transaction completed: ticket #{result['ticket_no']}, "
+                    f"net weight {result['net_weight']:.2f} KG"
                 )
                 
                 # Reset UI
@@ -1488,8 +1944,7 @@ class MainWindow(QMainWindow):
                     self.current_transaction['transaction_id']
                 )
                 
-                QMessageBox.information(self, "Transaction Voided", 
-                                       "Transaction has been voided.")
+                self.notify("Transaction has been voided.")
                 
                 self.reset_transaction_ui()
                 
@@ -1540,10 +1995,7 @@ class MainWindow(QMainWindow):
         
         # Update transaction status display
         if self.current_transaction:
-            current_text = self.transaction_status_text.toPlainText()
-            self.transaction_status_text.setPlainText(
-                f"{current_text}\n\n🔄 Status: {message}"
-            )
+            self.transaction_status_text.appendPlainText(f"\n🔄 Status: {message}")
     
     @pyqtSlot(dict)
     def on_weight_captured(self, weight_info: Dict):
@@ -1553,15 +2005,13 @@ class MainWindow(QMainWindow):
         weight_value = weight_info.get('weight', 0)
         
         if weight_type == 'gross':
-            self.transaction_status_text.setPlainText(
-                self.transaction_status_text.toPlainText() + 
-                f"\n\n⚖️ Gross weight captured: {weight_value:.2f} KG\n"
+            self.transaction_status_text.appendPlainText(
+                f"\n⚖️ Gross weight captured: {weight_value:.2f} KG\n"
                 f"Please remove vehicle from scale and click 'Capture Weight' again for tare."
             )
         elif weight_type == 'tare':
-            self.transaction_status_text.setPlainText(
-                self.transaction_status_text.toPlainText() + 
-                f"\n⚖️ Tare weight captured: {weight_value:.2f} KG\n"
+            self.transaction_status_text.appendPlainText(
+                f"⚖️ Tare weight captured: {weight_value:.2f} KG\n"
                 f"Transaction ready to complete."
             )
             
@@ -1571,9 +2021,8 @@ class MainWindow(QMainWindow):
     def on_transaction_completed(self, result: Dict):
         """Handle transaction completion"""
         
-        self.transaction_status_text.setPlainText(
-            self.transaction_status_text.toPlainText() + 
-            f"\n\n✅ Transaction completed!\n"
+        self.transaction_status_text.appendPlainText(
+            f"\n✅ Transaction completed!\n"
             f"Ticket #: {result.get('ticket_no', 'N/A')}\n"
             f"Net Weight: {result.get('net_weight', 0):.2f} KG"
         )
@@ -1585,23 +2034,49 @@ class MainWindow(QMainWindow):
         QMessageBox.critical(self, "Workflow Error", error_message)
         self.main_status_label.setText(f"Error: {error_message}")
     
+    def run_in_background(self, fn, on_finished, on_failed=None, *args,
+                          on_progress=None, **kwargs):
+        """Run fn on the shared thread pool; callbacks run on the UI thread
+        
+        With on_progress, fn also receives a progress_callback(int) argument.
+        """
+        task = BackgroundTask(fn, *args, **kwargs)
+        task.signals.finished.connect(on_finished)
+        if on_failed:
+            task.signals.failed.connect(on_failed)
+        if on_progress:
+            task.signals.progress.connect(on_progress)
+            task.kwargs['progress_callback'] = task.signals.progress.emit
+        self.thread_pool.start(task)
+    
     # Data management methods
     @pyqtSlot()
     def refresh_recent_transactions(self):
         """Refresh the recent transactions display"""
         
+        # Get recent transactions from database off the UI thread
+        self.run_in_background(
+            self.data_access.get_recent_transactions,
+            self.populate_recent_transactions,
+            lambda error: print(f"Error refreshing transactions: {error}"),
+            limit=10
+        )
+    
+    @pyqtSlot(object)
+    def populate_recent_transactions(self, transactions: List[Dict]):
+        """Fill the recent transactions table with query results"""
+        
         try:
-            # Get recent transactions from database
-            transactions = self.data_access.get_recent_transactions(limit=10)
-            
-            self.recent_transactions_table.setRowCount(len(transactions))
-            
-            for row, transaction in enumerate(transactions):
-                self.recent_transactions_table.setItem(row, 0, QTableWidgetItem(transaction.get('ticket_no', '')))
-                self.recent_transactions_table.setItem(row, 1, QTableWidgetItem(transaction.get('vehicle_no', '')))
-                self.recent_transactions_table.setItem(row, 2, QTableWidgetItem(f"{transaction.get('net_weight', 0):.2f} KG"))
-                self.recent_transactions_table.setItem(row, 3, QTableWidgetItem(transaction.get('status', '')))
-                self.recent_transactions_table.setItem(row, 4, QTableWidgetItem(transaction.get('created_at', '')))
+            self.recent_transactions_model.set_rows([
+                (
+                    transaction.get('ticket_no', ''),
+                    transaction.get('vehicle_no', ''),
+                    f"{transaction.get('net_weight', 0):.2f} KG",
+                    transaction.get('status', ''),
+                    transaction.get('created_at', ''),
+                )
+                for transaction in transactions
+            ])
                 
         except Exception as e:
             print(f"Error refreshing transactions: {e}")
@@ -1609,6 +2084,10 @@ class MainWindow(QMainWindow):
     def load_users_data(self):
         """Load users data into the users table"""
         
+        # Filled when the Settings tab is first built
+        if not hasattr(self, 'users_model'):
+            return
+        
         try:
             # This would load from the authentication service
             # For now, just placeholder
@@ -1618,18 +2097,16 @@ class MainWindow(QMainWindow):
                 {'username': 'operator', 'role': 'Operator', 'status': 'Active', 'last_login': '2025-08-23 14:20:00'}
             ]
             
-            self.users_table.setRowCount(len(users))
-            
-            for row, user in enumerate(users):
-                self.users_table.setItem(row, 0, QTableWidgetItem(user['username']))
-                self.users_table.setItem(row, 1, QTableWidgetItem(user['role']))
-                self.users_table.setItem(row, 2, QTableWidgetItem(user['status']))
-                self.users_table.setItem(row, 3, QTableWidgetItem(user['last_login']))
+            self.users_model.set_rows([
+                (user['username'], user['role'], user['status'], user['last_login'])
+                for user in users
+            ])
                 
         except Exception as e:
             print(f"Error loading users: {e}")
     
     # Placeholder methods for menu actions
+    @pyqtSlot()
     def logout(self):
         """Logout current user"""
         reply = QMessageBox.question(
@@ -1640,8 +2117,7 @@ class MainWindow(QMainWindow):
         
         if reply == QMessageBox.StandardButton.Yes:
             # Stop hardware monitoring
-            if self.weight_monitor:
-                self.weight_monitor.stop_monitoring()
+            self.stop_weight_monitoring()
             
             # Clear current state
             self.current_user = None
@@ -1650,48 +2126,61 @@ class MainWindow(QMainWindow):
             # Show login dialog again
             self.show_login_dialog()
     
+    @pyqtSlot()
     def test_hardware_connection(self):
         """Test hardware connection"""
         if self.rs232_config:
-            # Use the RS232 manager to test
-            result = RS232Manager().test_connection(self.rs232_config, "TEST\r\n")
-            
-            if result.success:
-                QMessageBox.information(self, "Connection Test", 
-                                       f"Connection successful!\n"
-                                       f"Response time: {result.response_time:.3f}s\n"
-                                       f"Bytes received: {result.bytes_received}")
-            else:
-                QMessageBox.warning(self, "Connection Test", 
-                                   f"Connection failed:\n{result.error_message}")
+            # Use the RS232 manager to test, without blocking the UI
+            self.main_status_label.setText(f"Testing {self.rs232_config.port}...")
+            self.run_in_background(
+                RS232Manager().test_connection,
+                self.on_hardware_test_finished,
+                lambda error: QMessageBox.warning(self, "Connection Test",
+                                                  f"Connection failed:\n{error}"),
+                self.rs232_config, "TEST\r\n"
+            )
         else:
             QMessageBox.warning(self, "No Configuration", 
                               "Please configure hardware first.")
     
+    @pyqtSlot(object)
+    def on_hardware_test_finished(self, result):
+        """Report the outcome of a background connection test"""
+        self.main_status_label.setText("Ready")
+        
+        if result.success:
+            QMessageBox.information(self, "Connection Test", 
+                                   f"Connection successful!\n"
+                                   f"Response time: {result.response_time:.3f}s\n"
+                                   f"Bytes received: {result.bytes_received}")
+        else:
+            QMessageBox.warning(self, "Connection Test", 
+                               f"Connection failed:\n{result.error_message}")
+    
+    @pyqtSlot()
     def search_transactions(self):
         """Search transactions based on filters"""
         # Implement transaction search
         QMessageBox.information(self, "Search", "Transaction search will be implemented.")
     
+    @pyqtSlot()
     def clear_search_filters(self):
         """Clear search filters"""
         self.search_vehicle_edit.clear()
         self.date_from_edit.setDate(QDate.currentDate().addDays(-30))
         self.date_to_edit.setDate(QDate.currentDate())
     
+    @pyqtSlot()
     def view_transaction_details(self):
         """View detailed transaction information"""
         QMessageBox.information(self, "View Details", "Transaction details view will be implemented.")
     
+    @pyqtSlot()
     def print_transaction_ticket(self):
         """Print transaction ticket"""
         QMessageBox.information(self, "Print", "Ticket printing will be implemented.")
     
-    def export_transactions(self):
-        """Export transactions data to CSV or JSON"""
-        try:
-            # Get all transactions from database
-            query = """
+    EXPORT_TRANSACTIONS_QUERY = """
             SELECT 
                 t.id, t.ticket_no, t.vehicle_no, t.gross_weight,
                 t.tare_weight, t.net_weight, t.product, t.customer,
@@ -1700,13 +2189,19 @@ class MainWindow(QMainWindow):
             FROM transactions t 
             ORDER BY t.created_at_utc DESC
             """
-            
-            transactions = self.data_access.execute_query(query)
-            
-            if not transactions:
-                QMessageBox.information(self, "No Data", "No transactions available to export.")
-                return
-            
+    
+    # Columns for CSV export
+    EXPORT_CSV_COLUMNS = [
+        'id', 'ticket_no', 'vehicle_no', 'gross_weight', 'tare_weight',
+        'net_weight', 'product', 'customer', 'transporter', 
+        'do_po_number', 'operator', 'status', 'weighing_mode',
+        'created_at_utc', 'completed_at_utc'
+    ]
+    
+    @pyqtSlot()
+    def export_transactions(self):
+        """Export transactions data to CSV or JSON"""
+        try:
             # Ask user for export format
             reply = QMessageBox.question(
                 self, "Export Format", 
@@ -1717,7 +2212,7 @@ class MainWindow(QMainWindow):
             if reply == QMessageBox.StandardButton.Cancel:
                 return
             
-            # Export based on user choice
+            # Export based on user choice; the writing runs on the thread pool
             if reply == QMessageBox.StandardButton.Yes:
                 # CSV Export
                 file_path, _ = QFileDialog.getSaveFileName(
@@ -1727,25 +2222,14 @@ class MainWindow(QMainWindow):
                 )
                 
                 if file_path:
-                    # Define columns for CSV export
-                    columns = [
-                        'id', 'ticket_no', 'vehicle_no', 'gross_weight', 'tare_weight',
-                        'net_weight', 'product', 'customer', 'transporter', 
-                        'do_po_number', 'operator', 'status', 'weighing_mode',
-                        'created_at_utc', 'completed_at_utc'
-                    ]
-                    
-                    if export_to_csv(transactions, file_path, columns):
-                        QMessageBox.information(
-                            self, "Export Successful",
-                            f"Transactions exported successfully to:\n{file_path}\n\n"
-                            f"Records exported: {len(transactions)}"
-                        )
-                    else:
-                        QMessageBox.critical(
-                            self, "Export Failed",
-                            "Failed to export transactions to CSV file."
-                        )
+                    self.start_export_progress()
+                    self.run_in_background(
+                        self.write_transactions_csv,
+                        lambda count: self.on_export_finished(file_path, count),
+                        self.on_export_failed,
+                        file_path,
+                        on_progress=self.on_export_progress
+                    )
             
             else:
                 # JSON Export
@@ -1756,28 +2240,15 @@ class MainWindow(QMainWindow):
                 )
                 
                 if file_path:
-                    export_data = {
-                        'export_info': {
-                            'exported_at': datetime.now().isoformat(),
-                            'total_records': len(transactions),
-                            'exported_by': self.current_user['username'] if self.current_user else 'Unknown'
-                        },
-                        'transactions': transactions
-                    }
-                    
-                    if export_to_json(export_data, file_path):
-                        file_size = os.path.getsize(file_path)
-                        QMessageBox.information(
-                            self, "Export Successful",
-                            f"Transactions exported successfully to:\n{file_path}\n\n"
-                            f"Records exported: {len(transactions)}\n"
-                            f"File size: {format_file_size(file_size)}"
-                        )
-                    else:
-                        QMessageBox.critical(
-                            self, "Export Failed",
-                            "Failed to export transactions to JSON file."
-                        )
+                    exported_by = self.current_user['username'] if self.current_user else 'Unknown'
+                    self.start_export_progress()
+                    self.run_in_background(
+                        self.write_transactions_json,
+                        lambda count: self.on_export_finished(file_path, count),
+                        self.on_export_failed,
+                        file_path, exported_by,
+                        on_progress=self.on_export_progress
+                    )
         
         except Exception as e:
             QMessageBox.critical(
@@ -1785,74 +2256,133 @@ class MainWindow(QMainWindow):
                 f"An error occurred during export:\n{str(e)}"
             )
     
+    def write_transactions_csv(self, file_path: str, progress_callback=None) -> int:
+        """Stream all transactions into a CSV file (runs on the thread pool)"""
+        rows = self.data_access.iter_query(self.EXPORT_TRANSACTIONS_QUERY)
+        written = export_to_csv(rows, file_path, self.EXPORT_CSV_COLUMNS,
+                                progress_callback=progress_callback)
+        if written is False:
+            raise IOError("Failed to export transactions to CSV file.")
+        return written
+    
+    def write_transactions_json(self, file_path: str, exported_by: str,
+                                progress_callback=None) -> int:
+        """Stream all transactions into a JSON file (runs on the thread pool)"""
+        rows = self.data_access.iter_query(self.EXPORT_TRANSACTIONS_QUERY)
+        written = export_rows_to_json(
+            rows, file_path, 'transactions',
+            info={'exported_at': datetime.now().isoformat(), 'exported_by': exported_by},
+            progress_callback=progress_callback
+        )
+        if written is False:
+            raise IOError("Failed to export transactions to JSON file.")
+        return written
+    
+    def start_export_progress(self):
+        """Show the busy indicator while an export runs"""
+        self.export_progress.setRange(0, 0)
+        self.export_progress.show()
+        self.main_status_label.setText("Exporting transactions...")
+    
+    @pyqtSlot(int)
+    def on_export_progress(self, rows_written: int):
+        """Report streamed export progress"""
+        self.main_status_label.setText(f"Exporting transactions... {rows_written} records")
+    
+    def on_export_finished(self, file_path: str, count: int):
+        """Report a finished export"""
+        self.export_progress.hide()
+        self.main_status_label.setText("Ready")
+        
+        if not count:
+            self.notify("No transactions available to export.")
+            return
+        
+        file_size = os.path.getsize(file_path)
+        self.notify(
+            f"Exported {count} transactions to {file_path} "
+            f"({format_file_size(file_size)})"
+        )
+    
+    @pyqtSlot(str)
+    def on_export_failed(self, error: str):
+        """Report a failed export"""
+        self.export_progress.hide()
+        self.main_status_label.setText("Export failed")
+        QMessageBox.critical(
+            self, "Export Error",
+            f"An error occurred during export:\n{error}"
+        )
+    
+    @pyqtSlot()
     def generate_report(self):
         """Generate selected report"""
         report_type = self.report_type_combo.currentText()
         self.report_preview.setPlainText(f"Generated {report_type} report would appear here.")
     
+    @pyqtSlot()
     def export_report_pdf(self):
         """Export report as PDF"""
         QMessageBox.information(self, "Export PDF", "PDF export will be implemented.")
     
+    @pyqtSlot()
     def save_system_settings(self):
         """Save system settings"""
-        QMessageBox.information(self, "Settings Saved", "System settings have been saved.")
+        self.notify("System settings have been saved.")
     
+    @pyqtSlot()
     def create_backup(self):
         """Create system backup"""
+        # Ask user for backup location
+        default_filename = f"scale_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.db"
+        
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "Create Database Backup", 
+            default_filename,
+            "Database files (*.db);;All files (*.*)"
+        )
+        
+        if not file_path:
+            return
+        
+        # The copy runs on the thread pool so the progress dialog stays live
+        self.start_backup_progress("Creating Backup", "Creating database backup...")
+        self.run_in_background(
+            self.data_access.create_backup,
+            lambda success: self.on_backup_finished(file_path, success),
+            lambda error: self.on_backup_failed("Backup Error", f"An error occurred during backup:\n{error}"),
+            file_path,
+            on_progress=self.backup_progress.setValue
+        )
+    
+    def on_backup_finished(self, file_path: str, success: bool):
+        """Report a finished backup"""
+        self.backup_progress.close()
+        
+        if not success:
+            QMessageBox.critical(
+                self, "Backup Failed",
+                f"Failed to create backup at:\n{file_path}\n\n"
+                "Please check file permissions and available disk space."
+            )
+            return
+        
         try:
-            # Ask user for backup location
-            default_filename = f"scale_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.db"
+            # Get file size for display
+            file_size = os.path.getsize(file_path)
             
-            file_path, _ = QFileDialog.getSaveFileName(
-                self, "Create Database Backup", 
-                default_filename,
-                "Database files (*.db);;All files (*.*)"
+            self.notify(
+                f"Database backup created: {file_path} ({format_file_size(file_size)})"
             )
             
-            if not file_path:
-                return
-            
-            # Create progress dialog
-            progress = QProgressBar()
-            progress.setRange(0, 0)  # Indeterminate progress
-            
-            # Show progress message
-            msg = QMessageBox(self)
-            msg.setWindowTitle("Creating Backup")
-            msg.setText("Creating database backup...")
-            msg.setStandardButtons(QMessageBox.StandardButton.NoButton)
-            msg.show()
-            
-            # Perform backup
-            success = self.data_access.create_backup(file_path)
-            msg.close()
-            
-            if success:
-                # Get file size for display
-                file_size = os.path.getsize(file_path)
-                
-                QMessageBox.information(
-                    self, "Backup Successful",
-                    f"Database backup created successfully:\n{file_path}\n\n"
-                    f"Backup size: {format_file_size(file_size)}\n"
-                    f"Created: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-                )
-                
-                # Log the backup action
-                if self.current_user:
-                    self.data_access.log_audit_action(
-                        operator_id=self.current_user['id'],
-                        action='DATABASE_BACKUP',
-                        entity='SYSTEM',
-                        entity_id='backup',
-                        reason=f'Manual backup to {os.path.basename(file_path)}'
-                    )
-            else:
-                QMessageBox.critical(
-                    self, "Backup Failed",
-                    f"Failed to create backup at:\n{file_path}\n\n"
-                    "Please check file permissions and available disk space."
+            # Log the backup action
+            if self.current_user:
+                self.data_access.log_audit_action(
+                    operator_id=self.current_user['id'],
+                    action='DATABASE_BACKUP',
+                    entity='SYSTEM',
+                    entity_id='backup',
+                    reason=f'Manual backup to {os.path.basename(file_path)}'
                 )
         
         except Exception as e:
@@ -1861,87 +2391,98 @@ class MainWindow(QMainWindow):
                 f"An error occurred during backup:\n{str(e)}"
             )
     
+    @pyqtSlot()
     def restore_backup(self):
         """Restore system from backup"""
-        try:
-            # Show warning about data loss
-            reply = QMessageBox.warning(
-                self, "Restore Database",
-                "⚠️ WARNING: This will replace ALL current data with the backup data.\n\n"
-                "Current transactions, users, and settings will be permanently lost.\n\n"
-                "Are you sure you want to continue?",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                QMessageBox.StandardButton.No
-            )
-            
-            if reply != QMessageBox.StandardButton.Yes:
-                return
-            
-            # Ask user for backup file
-            file_path, _ = QFileDialog.getOpenFileName(
-                self, "Select Backup File to Restore", 
-                "",
-                "Database files (*.db);;All files (*.*)"
+        # Show warning about data loss
+        reply = QMessageBox.warning(
+            self, "Restore Database",
+            "⚠️ WARNING: This will replace ALL current data with the backup data.\n\n"
+            "Current transactions, users, and settings will be permanently lost.\n\n"
+            "Are you sure you want to continue?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            QMessageBox.StandardButton.No
+        )
+        
+        if reply != QMessageBox.StandardButton.Yes:
+            return
+        
+        # Ask user for backup file
+        file_path, _ = QFileDialog.getOpenFileName(
+            self, "Select Backup File to Restore", 
+            "",
+            "Database files (*.db);;All files (*.*)"
+        )
+        
+        if not file_path:
+            return
+        
+        # Verify the backup file exists and is readable
+        if not os.path.exists(file_path):
+            QMessageBox.critical(
+                self, "File Not Found",
+                f"Backup file not found:\n{file_path}"
             )
-            
-            if not file_path:
-                return
-            
-            # Verify the backup file exists and is readable
-            if not os.path.exists(file_path):
-                QMessageBox.critical(
-                    self, "File Not Found",
-                    f"Backup file not found:\n{file_path}"
-                )
-                return
-            
-            # Show progress message
-            msg = QMessageBox(self)
-            msg.setWindowTitle("Restoring Backup")
-            msg.setText("Restoring database from backup...")
-            msg.setStandardButtons(QMessageBox.StandardButton.NoButton)
-            msg.show()
-            
-            # Perform restore
-            success = self.data_access.restore_backup(file_path)
-            msg.close()
-            
-            if success:
-                QMessageBox.information(
-                    self, "Restore Successful",
-                    f"Database restored successfully from:\n{file_path}\n\n"
-                    "The application will restart to apply changes."
-                )
-                
-                # Log the restore action (if possible)
-                try:
-                    if self.current_user:
-                        self.data_access.log_audit_action(
-                            operator_id=self.current_user['id'],
-                            action='DATABASE_RESTORE',
-                            entity='SYSTEM',
-                            entity_id='restore',
-                            reason=f'Manual restore from {os.path.basename(file_path)}'
-                        )
-                except:
-                    pass  # Log might fail after restore
-                
-                # Restart application
-                QApplication.quit()
-                
-            else:
-                QMessageBox.critical(
-                    self, "Restore Failed",
-                    f"Failed to restore from backup:\n{file_path}\n\n"
-                    "Please verify the backup file is valid and not corrupted."
-                )
+            return
         
-        except Exception as e:
+        # The copy runs on the thread pool; the modal dialog blocks other input
+        self.start_backup_progress("Restoring Backup", "Restoring database from backup...")
+        self.run_in_background(
+            self.data_access.restore_backup,
+            lambda success: self.on_restore_finished(file_path, success),
+            lambda error: self.on_backup_failed("Restore Error", f"An error occurred during restore:\n{error}"),
+            file_path,
+            on_progress=self.backup_progress.setValue
+        )
+    
+    def on_restore_finished(self, file_path: str, success: bool):
+        """Report a finished restore and restart"""
+        self.backup_progress.close()
+        
+        if not success:
             QMessageBox.critical(
-                self, "Restore Error",
-                f"An error occurred during restore:\n{str(e)}"
+                self, "Restore Failed",
+                f"Failed to restore from backup:\n{file_path}\n\n"
+                "Please verify the backup file is valid and not corrupted."
             )
+            return
+        
+        QMessageBox.information(
+            self, "Restore Successful",
+            f"Database restored successfully from:\n{file_path}\n\n"
+            "The application will restart to apply changes."
+        )
+        
+        # Log the restore action (if possible)
+        try:
+            if self.current_user:
+                self.data_access.log_audit_action(
+                    operator_id=self.current_user['id'],
+                    action='DATABASE_RESTORE',
+                    entity='SYSTEM',
+                    entity_id='restore',
+                    reason=f'Manual restore from {os.path.basename(file_path)}'
+                )
+        except:
+            pass  # Log might fail after restore
+        
+        # Restart application
+        QApplication.quit()
     
+    def start_backup_progress(self, title: str, text: str):
+        """Show a modal progress dialog for a backup or restore"""
+        self.backup_progress = QProgressDialog(text, None, 0, 100, self)
+        self.backup_progress.setWindowTitle(title)
+        self.backup_progress.setWindowModality(Qt.WindowModality.WindowModal)
+        self.backup_progress.setMinimumDuration(0)
+        self.backup_progress.setValue(0)
+    
+    def on_backup_failed(self, title: str, message: str):
+        """Report an exception raised by a backup or restore"""
+        self.backup_progress.close()
+        QMessageBox.critical(self, title, message)
+    
+    @pyqtSlot()
     def show_about_dialog(self):
         """Show about dialog"""
         QMessageBox.about(self, "About SCALE System",
@@ -1955,6 +2496,7 @@ class MainWindow(QMainWindow):
                          "• Comprehensive reporting\n\n"
                          "Built with PyQt6 and Python")
     
+    @pyqtSlot()
     def perform_timbang_1(self):
         """Perform first weighing (Timbang I)"""
         try:
@@ -1989,6 +2531,7 @@ class MainWindow(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Timbang I Error", f"Error performing first weighing: {str(e)}")
     
+    @pyqtSlot()
     def perform_timbang_2(self):
         """Perform second weighing (Timbang II)"""
         try:
@@ -2019,6 +2562,7 @@ class MainWindow(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Timbang II Error", f"Error performing second weighing: {str(e)}")
     
+    @pyqtSlot()
     def save_current_transaction(self):
         """Save current transaction"""
         try:
@@ -2043,22 +2587,20 @@ class MainWindow(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Save Error", f"Error saving transaction: {str(e)}")
     
+    @pyqtSlot()
     def refresh_hardware_connection(self):
         """Refresh/reconnect hardware connection"""
         try:
             self.main_status_label.setText("Refreshing hardware connection...")
             
             # Stop existing connection if any
-            if self.weight_monitor:
-                self.weight_monitor.stop_monitoring()
-                self.weight_monitor = None
+            self.stop_weight_monitoring()
             
             # Attempt to reconnect if configuration exists
             if self.rs232_config:
                 self.connect_to_hardware()
-                QMessageBox.information(
-                    self, "Hardware Refresh",
-                    f"Attempting to reconnect to {self.rs232_config.port}...\n\n"
+                self.notify(
+                    f"Attempting to reconnect to {self.rs232_config.port}... "
                     "Check the hardware status indicator for connection status."
                 )
             else:
@@ -2072,39 +2614,19 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "Refresh Error", f"Error refreshing hardware: {str(e)}")
             self.main_status_label.setText("Hardware refresh failed")
     
+    @pyqtSlot()
     def show_shortcuts_dialog(self):
         """Show keyboard shortcuts help dialog"""
-        shortcuts_text = """
-<b>SCALE System Keyboard Shortcuts</b><br><br>
-
-<b>File Operations:</b><br>
-Ctrl+N - New Transaction<br>
-Ctrl+Q - Exit Application<br><br>
-
-<b>Weighing Operations:</b><br>
-F2 - Timbang I (First Weigh)<br>
-F3 - Timbang II (Second Weigh)<br>
-F4 - New Transaction<br>
-Ctrl+S - Save Transaction<br><br>
-
-<b>Hardware & Tools:</b><br>
-F5 - Refresh/Reconnect Hardware<br>
-Ctrl+E - Export Transactions<br><br>
-
-<b>Help:</b><br>
-F1 - Show This Help Dialog<br><br>
-
-<i>💡 Tip: Most buttons also show their shortcuts in tooltips.</i>
-        """
-        
-        msg = QMessageBox(self)
-        msg.setWindowTitle("Keyboard Shortcuts")
-        msg.setTextFormat(Qt.TextFormat.RichText)
-        msg.setText(shortcuts_text)
-        msg.setStandardButtons(QMessageBox.StandardButton.Ok)
-        msg.exec()
+        if self.shortcuts_dialog is None:
+            self.shortcuts_dialog = QMessageBox(self)
+            self.shortcuts_dialog.setWindowTitle("Keyboard Shortcuts")
+            self.shortcuts_dialog.setTextFormat(Qt.TextFormat.RichText)
+            self.shortcuts_dialog.setText(SHORTCUTS_HTML)
+            self.shortcuts_dialog.setStandardButtons(QMessageBox.StandardButton.Ok)
+        self.shortcuts_dialog.exec()
     
     # Serial Console Methods
+    @pyqtSlot(bool)
     def toggle_packet_recording(self, enabled: bool):
         """Toggle packet recording on/off"""
         try:
@@ -2117,40 +2639,94 @@ F1 - Show This Help Dialog<br><br>
                 )
                 
                 if file_path:
-                    self.recording_file = open(file_path, 'w', encoding='utf-8')
+                    # Raw append-only fd; lines are batched in record_buffer
+                    self.recording_fd = os.open(
+                        file_path,
+                        os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_APPEND | getattr(os, 'O_BINARY', 0),
+                        0o644
+                    )
                     self.packet_recording = True
                     self.recording_file_label.setText(f"Recording to: {os.path.basename(file_path)}")
-                    self.recording_file_label.setStyleSheet("color: green; font-weight: bold;")
+                    set_style_state(self.recording_file_label, "recording", True)
                     
-                    # Write header
-                    self.recording_file.write(f"# SCALE System Serial Packet Recording\n")
-                    self.recording_file.write(f"# Started: {datetime.now().isoformat()}\n")
-                    self.recording_file.write(f"# Format: [TIMESTAMP] [DIRECTION] [DATA]\n\n")
-                    self.recording_file.flush()
+                    # Header goes out with the first batch
+                    self.record_buffer += (
+                        f"# SCALE System Serial Packet Recording\n"
+                        f"# Started: {datetime.now().isoformat()}\n"
+                        f"# Format: [TIMESTAMP] [DIRECTION] [DATA]\n\n"
+                    ).encode('utf-8')
+                    self.record_flush_timer.start()
                     
                     self.log_to_console(f"[SYSTEM] Packet recording started: {os.path.basename(file_path)}")
                 else:
                     self.recording_enabled.setChecked(False)
             else:
-                if self.recording_file:
-                    self.recording_file.write(f"\n# Recording ended: {datetime.now().isoformat()}\n")
-                    self.recording_file.close()
-                    self.recording_file = None
+                self.close_recording_file()
                 
                 self.packet_recording = False
                 self.recording_file_label.setText("Not recording")
-                self.recording_file_label.setStyleSheet("font-style: italic; color: #666;")
+                set_style_state(self.recording_file_label, "recording", False)
                 self.log_to_console("[SYSTEM] Packet recording stopped")
                 
         except Exception as e:
             QMessageBox.critical(self, "Recording Error", f"Error toggling packet recording: {str(e)}")
             self.recording_enabled.setChecked(False)
     
+    def refresh_timestamp_cache(self) -> float:
+        """Return time.time(), re-formatting the cached strings once per second"""
+        now = time.time()
+        sec = int(now)
+        if sec != self.ts_cached_sec:
+            moment = datetime.fromtimestamp(sec)
+            self.ts_cached_sec = sec
+            self.ts_cached_date = moment.strftime("%Y-%m-%d")
+            self.ts_cached_clock = moment.strftime("%H:%M:%S")
+        return now
+    
+    RECORD_FLUSH_BYTES = 64 * 1024  # Write early if a burst fills this much
+    
+    def record_packet(self, direction: str, data: str):
+        """Queue one packet line for the recording file"""
+        now = self.refresh_timestamp_cache()
+        millis = int((now - self.ts_cached_sec) * 1000)
+        self.record_buffer += (
+            f"[{self.ts_cached_date}T{self.ts_cached_clock}.{millis:03d}] [{direction}] {data}\n"
+        ).encode('utf-8')
+        if len(self.record_buffer) >= self.RECORD_FLUSH_BYTES:
+            self.flush_recording()
+    
+    @pyqtSlot()
+    def flush_recording(self):
+        """Write all queued packet lines to the recording file in one call"""
+        if not self.record_buffer or self.recording_fd is None:
+            return
+        pending = memoryview(bytes(self.record_buffer))
+        self.record_buffer.clear()
+        try:
+            while pending:
+                pending = pending[os.write(self.recording_fd, pending):]
+        except OSError as e:
+            self.errors_count += 1
+            self.log_to_console(f"[ERROR] Recording error: {str(e)}")
+    
+    def close_recording_file(self):
+        """Flush pending packets and close the recording file"""
+        self.record_flush_timer.stop()
+        if self.recording_fd is not None:
+            self.record_buffer += f"\n# Recording ended: {datetime.now().isoformat()}\n".encode('utf-8')
+            self.flush_recording()
+            os.close(self.recording_fd)
+            self.recording_fd = None
+        self.record_buffer.clear()
+    
+    @pyqtSlot()
     def clear_console(self):
         """Clear the console output"""
+        self.console_buffer.clear()
         self.console_output.clear()
         self.log_to_console("[SYSTEM] Console cleared")
     
+    @pyqtSlot()
     def save_console_output(self):
         """Save console output to file"""
         try:
@@ -2161,20 +2737,19 @@ F1 - Show This Help Dialog<br><br>
             )
             
             if file_path:
+                self.flush_console()
                 with open(file_path, 'w', encoding='utf-8') as f:
                     f.write(f"# SCALE System Console Output\n")
                     f.write(f"# Saved: {datetime.now().isoformat()}\n")
                     f.write(f"# " + "="*50 + "\n\n")
                     f.write(self.console_output.toPlainText())
                 
-                QMessageBox.information(
-                    self, "Console Saved",
-                    f"Console output saved to:\n{file_path}"
-                )
+                self.notify(f"Console output saved to {file_path}")
                 
         except Exception as e:
             QMessageBox.critical(self, "Save Error", f"Error saving console output: {str(e)}")
     
+    @pyqtSlot(bool)
     def toggle_console_pause(self, paused: bool):
         """Pause/resume console output"""
         self.console_paused = paused
@@ -2183,6 +2758,7 @@ F1 - Show This Help Dialog<br><br>
         else:
             self.log_to_console("[SYSTEM] Console output resumed")
     
+    @pyqtSlot()
     def send_manual_command(self):
         """Send manual command from input field"""
         command = self.command_input.text().strip()
@@ -2190,14 +2766,17 @@ F1 - Show This Help Dialog<br><br>
             self.send_serial_command(command)
             self.command_input.clear()
     
-    def send_predefined_command(self, command: str):
-        """Send a predefined command"""
+    # Commands offered as quick buttons in the serial console
+    QUICK_COMMANDS = ("STATUS", "ZERO", "TARE", "TEST")
+    
+    def send_predefined_command(self, command: str, checked: bool = False):
+        """Send a predefined command (checked comes from QPushButton.clicked)"""
         self.send_serial_command(command)
     
     def send_serial_command(self, command: str):
         """Send command to serial port and log it"""
         try:
-            if not self.is_connected or not self.weight_monitor:
+            if not self.is_connected:
                 self.command_response.setText("Error: Not connected to hardware")
                 return
             
@@ -2208,9 +2787,8 @@ F1 - Show This Help Dialog<br><br>
             self.log_to_console(f"[TX] {command}")
             
             # Record packet if recording enabled
-            if self.packet_recording and self.recording_file:
-                self.recording_file.write(f"[{datetime.now().isoformat()}] [TX] {command}\n")
-                self.recording_file.flush()
+            if self.packet_recording and self.recording_fd is not None:
+                self.record_packet("TX", command)
             
             # Here you would send the actual command to the serial port
             # For now, simulate a response
@@ -2222,28 +2800,28 @@ F1 - Show This Help Dialog<br><br>
                 self.command_response.setText(response)
                 
                 # Record response packet if recording enabled
-                if self.packet_recording and self.recording_file:
-                    self.recording_file.write(f"[{datetime.now().isoformat()}] [RX] {response}\n")
-                    self.recording_file.flush()
+                if self.packet_recording and self.recording_fd is not None:
+                    self.record_packet("RX", response)
             
         except Exception as e:
             error_msg = f"Command error: {str(e)}"
             self.command_response.setText(error_msg)
             self.log_to_console(f"[ERROR] {error_msg}")
     
+    # Canned replies used by simulate_command_response
+    SIMULATED_RESPONSES = {
+        'STATUS': 'SCALE_OK STABLE 1250.50 KG',
+        'ZERO': 'ZERO_OK',
+        'TARE': 'TARE_OK 125.30 KG',
+        'TEST': 'TEST_OK SN:12345 VER:1.2.3'
+    }
+    
     def simulate_command_response(self, command: str) -> str:
         """Simulate hardware response to commands (for testing)"""
         command = command.upper()
-        
-        responses = {
-            'STATUS': 'SCALE_OK STABLE 1250.50 KG',
-            'ZERO': 'ZERO_OK',
-            'TARE': 'TARE_OK 125.30 KG',
-            'TEST': 'TEST_OK SN:12345 VER:1.2.3'
-        }
-        
-        return responses.get(command, f"UNKNOWN_COMMAND: {command}")
+        return self.SIMULATED_RESPONSES.get(command, f"UNKNOWN_COMMAND: {command}")
     
+    @pyqtSlot()
     def open_master_data_dialog(self):
         """Open the master data management dialog"""
         try:
@@ -2254,86 +2832,105 @@ F1 - Show This Help Dialog<br><br>
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to open master data management: {str(e)}")
     
+    @pyqtSlot()
     def refresh_dropdown_data(self):
-        """Refresh all dropdown data from database"""
-        try:
-            self.populate_products_dropdown()
-            self.populate_parties_dropdown()
-            self.populate_transporters_dropdown()
-        except Exception as e:
-            print(f"Error refreshing dropdown data: {e}")
+        """Refresh all dropdown data from database off the UI thread"""
+        self.run_in_background(
+            self.data_access.get_master_data_snapshot,
+            self.populate_dropdowns,
+            lambda error: print(f"Error refreshing dropdown data: {error}")
+        )
     
-    def populate_products_dropdown(self):
-        """Populate products dropdown from database"""
-        try:
-            self.product_combo.clear()
-            self.product_combo.addItem("-- Select Product --", None)
+    @pyqtSlot(object)
+    def populate_dropdowns(self, master_data: Dict[str, List[Dict]]):
+        """Fill the weighing dropdowns with fetched master data"""
+        self.populate_products_dropdown(master_data['products'])
+        self.populate_parties_dropdown(master_data['parties'])
+        self.populate_transporters_dropdown(master_data['transporters'])
+    
+    def fill_combo(self, combo: QComboBox, placeholder: str, items: List[tuple]):
+        """Replace combo entries with (text, data) items, keeping the selection
+        
+        Signals are blocked while the entries change, so listeners see no
+        intermediate index changes.
+        """
+        previous = combo.currentData()
+        
+        with QSignalBlocker(combo):
+            combo.clear()
+            combo.addItem(placeholder, None)
+            combo.addItems([text for text, _ in items])
+            for index, (_, data) in enumerate(items, start=1):
+                combo.setItemData(index, data)
             
-            with self.data_access.get_connection() as conn:
-                results = conn.execute("""
-                    SELECT id, name FROM products 
-                    WHERE is_active = 1 
-                    ORDER BY name
-                """).fetchall()
-                
-                for product in results:
-                    self.product_combo.addItem(product['name'], product['id'])
+            index = combo.findData(previous) if previous is not None else -1
+            combo.setCurrentIndex(max(index, 0))
+    
+    def populate_products_dropdown(self, products: List[Dict]):
+        """Populate products dropdown from master data rows"""
+        try:
+            self.fill_combo(self.product_combo, "-- Select Product --", [
+                (product['name'], product['id'])
+                for product in products
+            ])
                     
         except Exception as e:
             print(f"Error loading products: {e}")
     
-    def populate_parties_dropdown(self):
-        """Populate customers/suppliers dropdown from database"""
+    def populate_parties_dropdown(self, parties: List[Dict]):
+        """Populate customers/suppliers dropdown from master data rows"""
         try:
-            self.party_combo.clear()
-            self.party_combo.addItem("-- Select Customer/Supplier --", None)
-            
-            with self.data_access.get_connection() as conn:
-                results = conn.execute("""
-                    SELECT id, name, type FROM parties 
-                    WHERE is_active = 1 
-                    ORDER BY name
-                """).fetchall()
-                
-                for party in results:
-                    display_name = f"{party['name']} ({party['type']})"
-                    self.party_combo.addItem(display_name, party['id'])
+            self.fill_combo(self.party_combo, "-- Select Customer/Supplier --", [
+                (f"{party['name']} ({party['type']})", party['id'])
+                for party in parties
+            ])
                     
         except Exception as e:
             print(f"Error loading customers/suppliers: {e}")
     
-    def populate_transporters_dropdown(self):
-        """Populate transporters dropdown from database"""
+    def populate_transporters_dropdown(self, transporters: List[Dict]):
+        """Populate transporters dropdown from master data rows"""
         try:
-            self.transporter_combo.clear()
-            self.transporter_combo.addItem("-- Select Transporter --", None)
-            
-            with self.data_access.get_connection() as conn:
-                results = conn.execute("""
-                    SELECT id, name FROM transporters 
-                    WHERE is_active = 1 
-                    ORDER BY name
-                """).fetchall()
-                
-                for transporter in results:
-                    self.transporter_combo.addItem(transporter['name'], transporter['id'])
+            self.fill_combo(self.transporter_combo, "-- Select Transporter --", [
+                (transporter['name'], transporter['id'])
+                for transporter in transporters
+            ])
                     
         except Exception as e:
             print(f"Error loading transporters: {e}")
     
     def log_to_console(self, message: str):
-        """Log message to console output"""
+        """Queue a message for the console output (see flush_console)"""
         if not self.console_paused:
-            timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]  # Include milliseconds
-            formatted_message = f"[{timestamp}] {message}"
-            self.console_output.append(formatted_message)
+            now = self.refresh_timestamp_cache()
+            millis = int((now - self.ts_cached_sec) * 1000)
+            self.console_buffer.append(f"[{self.ts_cached_clock}.{millis:03d}] {message}")
+    
+    @pyqtSlot()
+    def console_tick(self):
+        """Flush queued console lines and statistics; runs from console_tick_timer"""
+        self.flush_console()
+        self.update_console_statistics()
+    
+    def flush_console(self):
+        """Append all queued console lines to the widget in one edit"""
+        if not self.console_buffer:
+            return
+        text = "\n".join(self.console_buffer)
+        self.console_buffer.clear()
+        self.console_output.appendPlainText(text)
     
     def update_console_statistics(self):
-        """Update console statistics display"""
+        """Update console statistics display, skipping unchanged counters"""
+        stats = (self.packets_received, self.bytes_received, self.errors_count)
+        if stats == self.stats_shown:
+            return
+        self.stats_shown = stats
         self.packets_received_label.setText(f"Packets: {self.packets_received}")
         self.bytes_received_label.setText(f"Bytes: {self.bytes_received}")
         self.errors_count_label.setText(f"Errors: {self.errors_count}")
     
+    @pyqtSlot()
     def refresh_all_data(self):
         """Refresh all displayed data"""
         self.refresh_recent_transactions()
@@ -2343,9 +2940,18 @@ F1 - Show This Help Dialog<br><br>
     def closeEvent(self, event):
         """Handle application close event"""
         
-        # Stop hardware monitoring
-        if self.weight_monitor:
-            self.weight_monitor.stop_monitoring()
+        # Stop hardware monitoring and the monitoring thread
+        self.weight_refresh_timer.stop()
+        self.weight_worker.interrupt_read()
+        self.weight_thread.quit()
+        self.weight_thread.wait()
+        self.weight_worker.stop_loop()
+        
+        if self.prewarm_worker and self.prewarm_worker.isRunning():
+            self.prewarm_worker.wait()
+        
+        # Don't lose packets still queued for the recording file
+        self.close_recording_file()
         
         # Close database connections
         if hasattr(self, 'data_access'):
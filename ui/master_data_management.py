@@ -4,7 +4,6 @@ SCALE System Master Data Management Dialog
 Provides CRUD operations for Products, Customers/Suppliers, and Transporters
 """
 
-import sys
 import uuid
 from datetime import datetime
 from typing import Optional, List, Dict, Any
@@ -19,8 +18,7 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer
 from PyQt6.QtGui import QFont, QIcon
 
-sys.path.append('..')
-from database.data_access import DataAccessLayer
+from database.data_access import get_data_access
 from core.config import DATABASE_PATH
 
 class ProductEditDialog(QDialog):
@@ -334,7 +332,8 @@ class MasterDataDialog(QDialog):
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.db_access = DataAccessLayer(str(DATABASE_PATH))
+        self.db_access = get_data_access(str(DATABASE_PATH))
+        self.data_changed.connect(self.db_access.invalidate_master_data)
         self.setup_ui()
         self.load_all_data()
     
@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+"""
+SCALE System Shared UI Styling
+Fonts shared across dialogs, built once per process
+"""
+
+from PyQt6.QtGui import QFont
+
+BASE_FONT_FAMILIES = ["Segoe UI", "Arial"]
+
+# Built lazily because QFont needs a QGuiApplication to exist
+_base_font = None
+
+def get_base_font() -> QFont:
+    """Get the shared base font used by all dialogs"""
+    global _base_font
+    if _base_font is None:
+        _base_font = QFont()
+        _base_font.setFamilies(BASE_FONT_FAMILIES)
+        _base_font.setStyleHint(QFont.StyleHint.SansSerif)
+    return _base_font
@@ -5,13 +5,15 @@ Common utility functions and helpers
 """
 
 import hashlib
+import hmac
 import uuid
 import re
 import json
 import csv
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
 from decimal import Decimal, ROUND_HALF_UP
+from functools import lru_cache
 import qrcode
 from io import BytesIO
 import base64
@@ -40,13 +42,19 @@ def hash_pin(pin: str) -> str:
 
 def verify_pin(pin: str, pin_hash: str) -> bool:
     """Verify PIN against hash"""
-    return hash_pin(pin) == pin_hash
+    return hmac.compare_digest(hash_pin(pin).encode(), pin_hash.encode())
 
 def format_weight(weight: float, decimal_places: int = 2, unit: str = 'KG') -> str:
     """Format weight for display"""
     if weight is None:
         return 'N/A'
     
+    # A steady scale repeats the same reading, so reuse the formatted string.
+    # Adding 0.0 turns -0.0 into 0.0; the two share a cache key
+    return _format_rounded_weight(round(weight, decimal_places) + 0.0, decimal_places, unit)
+
+@lru_cache(maxsize=2048)
+def _format_rounded_weight(weight: float, decimal_places: int, unit: str) -> str:
     formatted = f"{weight:.{decimal_places}f}"
     return f"{formatted} {unit}"
 
@@ -116,23 +124,25 @@ def validate_vehicle_number(vehicle_no: str) -> bool:
     pattern = r'^[A-Z0-9-]{1,20}$'
     return bool(re.match(pattern, vehicle_no.upper()))
 
+# 4-6 digits
+PIN_PATTERN = re.compile(r'^\d{4,6}$')
+
+# 3-20 characters, alphanumeric and underscore
+USERNAME_PATTERN = re.compile(r'^[a-zA-Z0-9_]{3,20}$')
+
 def validate_pin(pin: str) -> bool:
     """Validate PIN format"""
     if not pin:
         return True  # PIN is optional
     
-    # 4-6 digits
-    pattern = r'^\d{4,6}$'
-    return bool(re.match(pattern, pin))
+    return bool(PIN_PATTERN.match(pin))
 
 def validate_username(username: str) -> bool:
     """Validate username format"""
     if not username:
         return False
     
-    # 3-20 characters, alphanumeric and underscore
-    pattern = r'^[a-zA-Z0-9_]{3,20}$'
-    return bool(re.match(pattern, username))
+    return bool(USERNAME_PATTERN.match(username))
 
 def sanitize_filename(filename: str) -> str:
     """Sanitize filename for safe file operations"""
@@ -181,25 +191,45 @@ def generate_qr_code(data: str, size: int = 10) -> str:
         print(f"QR code generation error: {e}")
         return ""
 
-def export_to_csv(data: List[Dict], filename: str, columns: Optional[List[str]] = None) -> bool:
-    """Export data to CSV file"""
+def export_to_csv(data: Iterable[Dict], filename: str, columns: Optional[List[str]] = None,
+                  progress_callback: Optional[Callable[[int], None]] = None,
+                  chunk_size: int = 1000) -> Union[int, bool]:
+    """Export data to CSV file
+    
+    data may be any iterable of dicts, including a generator streaming rows
+    from a cursor; rows are written in chunks through a 64 KiB buffer.
+    Returns the number of rows written (0 if there was nothing to export),
+    or False if writing failed.
+    """
     try:
-        if not data:
-            return False
+        rows = iter(data)
+        first_row = next(rows, None)
+        if first_row is None:
+            return 0
         
         if columns is None:
-            columns = list(data[0].keys())
+            columns = list(first_row.keys())
         
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+        written = 0
+        with open(filename, 'w', newline='', encoding='utf-8', buffering=65536) as csvfile:
             writer = csv.DictWriter(csvfile, fieldnames=columns)
             writer.writeheader()
             
-            for row in data:
-                # Filter row to include only specified columns
-                filtered_row = {col: row.get(col, '') for col in columns}
-                writer.writerow(filtered_row)
+            # Filter rows to include only specified columns
+            chunk = [{col: first_row.get(col, '') for col in columns}]
+            for row in rows:
+                chunk.append({col: row.get(col, '') for col in columns})
+                if len(chunk) >= chunk_size:
+                    writer.writerows(chunk)
+                    written += len(chunk)
+                    chunk = []
+                    if progress_callback:
+                        progress_callback(written)
+            
+            writer.writerows(chunk)
+            written += len(chunk)
         
-        return True
+        return written
     except Exception as e:
         print(f"CSV export error: {e}")
         return False
@@ -214,6 +244,47 @@ def export_to_json(data: Any, filename: str) -> bool:
         print(f"JSON export error: {e}")
         return False
 
+def export_rows_to_json(rows: Iterable[Dict], filename: str, list_key: str,
+                        info: Optional[Dict] = None,
+                        progress_callback: Optional[Callable[[int], None]] = None,
+                        chunk_size: int = 1000) -> Union[int, bool]:
+    """Export rows to a JSON file as a list under list_key
+    
+    Rows are encoded and written one at a time, so a generator streaming
+    from a cursor is never held in memory. An 'export_info' object built
+    from info plus 'total_records' is written after the list, once the
+    row count is known. Returns the number of rows written (0 if there was
+    nothing to export, in which case no file is created), or False if
+    writing failed.
+    """
+    try:
+        rows = iter(rows)
+        first_row = next(rows, None)
+        if first_row is None:
+            return 0
+        
+        written = 0
+        with open(filename, 'w', encoding='utf-8', buffering=65536) as jsonfile:
+            jsonfile.write('{\n  ' + json.dumps(list_key) + ': [\n    ')
+            jsonfile.write(json.dumps(first_row, default=str))
+            written = 1
+            for row in rows:
+                jsonfile.write(',\n    ')
+                jsonfile.write(json.dumps(row, default=str))
+                written += 1
+                if progress_callback and written % chunk_size == 0:
+                    progress_callback(written)
+            
+            export_info = dict(info or {}, total_records=written)
+            jsonfile.write('\n  ],\n  "export_info": ')
+            jsonfile.write(json.dumps(export_info, default=str))
+            jsonfile.write('\n}\n')
+        
+        return written
+    except Exception as e:
+        print(f"JSON export error: {e}")
+        return False
+
 def calculate_age_hours(timestamp_str: str) -> float:
     """Calculate age in hours from timestamp"""
     try:
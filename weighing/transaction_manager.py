@@ -101,27 +101,28 @@ class TransactionManager:
                 ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """
             
-            self.db.execute_insert(query, (
-                transaction_id, ticket_no, vehicle_no, product_id, party_id,
-                transporter_id, do_po_no, mode.value, TransactionStatus.PENDING.value,
-                notes, user['id'], now.isoformat()
-            ))
+            with self.db.batch():
+                self.db.execute_insert(query, (
+                    transaction_id, ticket_no, vehicle_no, product_id, party_id,
+                    transporter_id, do_po_no, mode.value, TransactionStatus.PENDING.value,
+                    notes, user['id'], now.isoformat()
+                ))
             
-            # Log transaction creation
-            self.db.log_audit_action(
-                operator_id=user['username'],
-                action='CREATE_TRANSACTION',
-                entity='transactions',
-                entity_id=transaction_id,
-                reason=f'New {mode.value} transaction started',
-                before_state={},
-                after_state={
-                    'ticket_no': ticket_no,
-                    'vehicle_no': vehicle_no,
-                    'mode': mode.value,
-                    'status': TransactionStatus.PENDING.value
-                }
-            )
+                # Log transaction creation
+                self.db.log_audit_action(
+                    operator_id=user['id'],
+                    action='CREATE_TRANSACTION',
+                    entity='transactions',
+                    entity_id=transaction_id,
+                    reason=f'New {mode.value} transaction started',
+                    before_state={},
+                    after_state={
+                        'ticket_no': ticket_no,
+                        'vehicle_no': vehicle_no,
+                        'mode': mode.value,
+                        'status': TransactionStatus.PENDING.value
+                    }
+                )
             
             # Create and return Transaction object
             transaction = Transaction(
@@ -177,27 +178,30 @@ class TransactionManager:
                 ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
             """
             
-            self.db.execute_insert(query, (
-                weigh_event_id, transaction_id, sequence, int(is_gross),
-                weight, int(is_stable), now.isoformat(), raw_payload
-            ))
-            
-            # Log weight capture
             user = self.auth_service.get_current_user()
-            self.db.log_audit_action(
-                operator_id=user['username'] if user else 'system',
-                action='CAPTURE_WEIGHT',
-                entity='weigh_events',
-                entity_id=weigh_event_id,
-                reason=f'Weight captured: sequence {sequence}',
-                before_state={},
-                after_state={
-                    'weight': weight,
-                    'sequence': sequence,
-                    'stable': is_stable,
-                    'gross_flag': is_gross
-                }
-            )
+            
+            with self.db.batch():
+                self.db.execute_insert(query, (
+                    weigh_event_id, transaction_id, sequence, int(is_gross),
+                    weight, int(is_stable), now.isoformat(), raw_payload
+                ))
+            
+                # Log weight capture; audit_log.operator_id must reference a user
+                if user:
+                    self.db.log_audit_action(
+                        operator_id=user['id'],
+                        action='CAPTURE_WEIGHT',
+                        entity='weigh_events',
+                        entity_id=weigh_event_id,
+                        reason=f'Weight captured: sequence {sequence}',
+                        before_state={},
+                        after_state={
+                            'weight': weight,
+                            'sequence': sequence,
+                            'stable': is_stable,
+                            'gross_flag': is_gross
+                        }
+                    )
             
             return True
             
@@ -243,28 +247,29 @@ class TransactionManager:
                 WHERE id = ?
             """
             
-            self.db.execute_insert(query, (
-                TransactionStatus.COMPLETE.value,
-                net_weight,
-                user['id'],
-                now.isoformat(),
-                transaction_id
-            ))
+            with self.db.batch():
+                self.db.execute_insert(query, (
+                    TransactionStatus.COMPLETE.value,
+                    net_weight,
+                    user['id'],
+                    now.isoformat(),
+                    transaction_id
+                ))
             
-            # Log transaction completion
-            self.db.log_audit_action(
-                operator_id=user['username'],
-                action='COMPLETE_TRANSACTION',
-                entity='transactions',
-                entity_id=transaction_id,
-                reason='Transaction completed',
-                before_state={'status': 'pending'},
-                after_state={
-                    'status': 'complete',
-                    'net_weight': net_weight,
-                    'completed_by': user['username']
-                }
-            )
+                # Log transaction completion
+                self.db.log_audit_action(
+                    operator_id=user['id'],
+                    action='COMPLETE_TRANSACTION',
+                    entity='transactions',
+                    entity_id=transaction_id,
+                    reason='Transaction completed',
+                    before_state={'status': 'pending'},
+                    after_state={
+                        'status': 'complete',
+                        'net_weight': net_weight,
+                        'completed_by': user['username']
+                    }
+                )
             
             return True
             
@@ -299,25 +304,26 @@ class TransactionManager:
                 
             # Update transaction status
             query = "UPDATE transactions SET status = ? WHERE id = ?"
-            self.db.execute_insert(query, (TransactionStatus.VOID.value, transaction_id))
-            
-            # Log void action
-            self.db.log_audit_action(
-                operator_id=user['username'],
-                action='VOID_TRANSACTION',
-                entity='transactions',
-                entity_id=transaction_id,
-                reason=reason,
-                before_state={
-                    'status': transaction.status.value,
-                    'net_weight': transaction.net_weight
-                },
-                after_state={
-                    'status': 'void',
-                    'voided_by': user['username'],
-                    'void_reason': reason
-                }
-            )
+            with self.db.batch():
+                self.db.execute_insert(query, (TransactionStatus.VOID.value, transaction_id))
+            
+                # Log void action
+                self.db.log_audit_action(
+                    operator_id=user['id'],
+                    action='VOID_TRANSACTION',
+                    entity='transactions',
+                    entity_id=transaction_id,
+                    reason=reason,
+                    before_state={
+                        'status': transaction.status.value,
+                        'net_weight': transaction.net_weight
+                    },
+                    after_state={
+                        'status': 'void',
+                        'voided_by': user['username'],
+                        'void_reason': reason
+                    }
+                )
             
             return True
             
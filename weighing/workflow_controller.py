@@ -8,7 +8,7 @@ from .transaction_manager import TransactionManager, Transaction, WeighingMode
 from .weighing_modes import WeighingModeFactory, WeighingModeBase, WeighingStep
 from .weight_validator import WeightValidator
 from hardware.serial_service import SerialService
-from database.data_access import DataAccessLayer
+from database.data_access import get_data_access
 from auth.auth_service import get_auth_service
 from auth.rbac import Permission
 from core.config import DATABASE_PATH
@@ -39,7 +39,7 @@ class WorkflowController(QObject):
         super().__init__()
         
         # Core components
-        self.db_manager = DataAccessLayer(str(DATABASE_PATH))
+        self.db_manager = get_data_access(str(DATABASE_PATH))
         self.transaction_manager = TransactionManager(self.db_manager)
         self.weight_validator = WeightValidator()
         self.auth_service = get_auth_service()